@@ -5,7 +5,49 @@ NO pandas or csv library used - built from scratch
 """
 
 import re
-from typing import List, Dict, Any, Union, Optional, Callable
+import operator
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, lru_cache
+from typing import List, Dict, Any, Union, Optional, Callable, Tuple
+
+
+# Single tokenizer for condition strings: AND/OR connectors or comparison
+# operators, including IN / NOT IN when followed by a parenthesized list.
+# Quoted literals (a quote not preceded by a word character, so the
+# apostrophe in O'Brien does not open one) are matched as group 3 so that
+# connectors and operators inside them are skipped.
+_COND_RE = re.compile(
+    r'''\s+(and|or)\s+|(>=|<=|!=|==|=|>|<|\s+not\s+in\s*(?=\()|\s+in\s*(?=\())'''
+    r'''|(?<!\w)('[^']*'|"[^"]*")''',
+    re.IGNORECASE
+)
+
+# Items of an IN list: quoted strings (which may contain commas) or bare values
+_IN_ITEM_RE = re.compile(r"""\s*('[^']*'|"[^"]*"|[^,]+)""")
+
+# Literal fast paths: plain integers parse directly, and text with no digit
+# (and no nan/inf) can never be a number, so int()/float() are not even tried
+_INT_LITERAL_RE = re.compile(r'[+-]?\d+')
+_NUMBER_HINT_RE = re.compile(r'\d|nan|inf', re.IGNORECASE)
+
+# Comparison operator -> function, so evaluating a clause needs no if-chain
+_OPS = {
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '==': operator.eq,
+    '=': operator.eq,
+    '!=': operator.ne,
+}
+
+# Inline expressions used by generated filter kernels, matching _compare:
+# None never satisfies an ordering, and ==, !=, in and not in already treat
+# None correctly
+_FUSED_ORDERING = '({a} is not None and {b} is not None and {a} {op} {b})'
+_FUSED_ORDERING_LITERAL = '({a} is not None and {a} {op} {b})'
+_FUSED_EQUALITY = '({a} {op} {b})'
 
 
 class DataFrame:
@@ -19,18 +61,71 @@ class DataFrame:
             data: List of lists representing rows
             columns: List of column names
         """
-        self.data = data if data is not None else []
+        data = data if data is not None else []
         self.columns = columns if columns is not None else []
-        self._validate_structure()
+        self._validate_structure(data)
+        
+        # Store data column-wise (one list per column) so operations only
+        # touch the columns they need
+        self._nrows = len(data)
+        if data:
+            self._cols = [list(col) for col in zip(*data)]
+        else:
+            self._cols = [[] for _ in self.columns]
+    
+    @property
+    def columns(self) -> List[str]:
+        """Column names"""
+        return self._columns
+    
+    @columns.setter
+    def columns(self, columns: List[str]):
+        self._columns = columns
+        # Name -> position lookup, first occurrence wins like list.index
+        self._col_idx = {}
+        for i, col in enumerate(columns):
+            self._col_idx.setdefault(col, i)
     
-    def _validate_structure(self):
+    def _validate_structure(self, data: List[List[Any]]):
         """Ensure data structure is valid"""
-        if self.data and self.columns:
+        if data and self.columns:
             expected_cols = len(self.columns)
-            for i, row in enumerate(self.data):
+            for i, row in enumerate(data):
                 if len(row) != expected_cols:
                     raise ValueError(f"Row {i} has {len(row)} values but {expected_cols} columns expected")
     
+    @classmethod
+    def _from_cols(cls, cols: List[List[Any]], columns: List[str], nrows: int = 0) -> 'DataFrame':
+        """
+        Create DataFrame directly from column lists (no row -> column conversion)
+        
+        Args:
+            cols: List of column value lists, in the same order as columns
+            columns: List of column names
+            nrows: Row count, only used when there are no columns
+            
+        Returns:
+            DataFrame instance sharing the given column lists
+        """
+        df = cls.__new__(cls)
+        df.columns = columns
+        df._cols = cols
+        df._nrows = len(cols[0]) if cols else nrows
+        return df
+    
+    @property
+    def data(self) -> List[List[Any]]:
+        """Row view of the DataFrame (list of lists), synthesized from the columns"""
+        if not self._cols:
+            # zip() of no columns yields nothing, but each row is still there
+            return [[] for _ in range(self._nrows)]
+        return [list(row) for row in zip(*self._cols)]
+    
+    def _take(self, indices: List[int]) -> 'DataFrame':
+        """Return new DataFrame with the rows at the given positions"""
+        cols = [[col[i] for i in indices] for col in self._cols]
+        return DataFrame._from_cols(cols, self.columns, nrows=len(indices))
+    
     @classmethod
     def from_csv_data(cls, csv_data: Dict[str, Any]) -> 'DataFrame':
         """
@@ -44,15 +139,43 @@ class DataFrame:
         """
         headers = csv_data.get('headers', [])
         data = csv_data.get('data', [])
-        return cls(data=data, columns=headers)
+        df = cls(data=data, columns=headers)
+        df._pool_categoricals()
+        return df
+    
+    def _pool_categoricals(self, max_ratio: float = 0.05):
+        """
+        Share one object per distinct value in low-cardinality columns
+        
+        The parser creates a new object for every cell, so a 'genre' column
+        holds thousands of copies of a dozen strings and a 'year' column
+        thousands of equal ints. Pooling them saves that memory and makes key
+        comparisons in group_by/join identity checks. Only str and int values
+        are pooled, keyed by (type, value), since those compare equal only
+        when they are the same value; floats are left alone (-0.0 == 0.0).
+        
+        Args:
+            max_ratio: Pool a column only if distinct values / rows is below this
+        """
+        limit = self._nrows * max_ratio
+        for c, col in enumerate(self._cols):
+            pool = {}
+            for value in col:
+                if value.__class__ is str or value.__class__ is int:
+                    pool.setdefault((value.__class__, value), value)
+                    if len(pool) > limit:
+                        break
+            else:
+                if pool:
+                    self._cols[c] = [pool.get((v.__class__, v), v) for v in col]
     
     def __len__(self) -> int:
         """Return number of rows"""
-        return len(self.data)
+        return self._nrows
     
     def __repr__(self) -> str:
         """String representation of DataFrame"""
-        if not self.data:
+        if not self._nrows:
             return f"DataFrame(empty, columns={self.columns})"
         
         # Create string representation
@@ -64,12 +187,12 @@ class DataFrame:
         lines.append("-" * len(header_line))
         
         # Data rows (show first 10)
-        for i, row in enumerate(self.data[:10]):
+        for row in zip(*(col[:10] for col in self._cols)):
             row_line = " | ".join(str(val) if val is not None else "None" for val in row)
             lines.append(row_line)
         
-        if len(self.data) > 10:
-            lines.append(f"... ({len(self.data) - 10} more rows)")
+        if self._nrows > 10:
+            lines.append(f"... ({self._nrows - 10} more rows)")
         
         return "\n".join(lines)
     
@@ -84,11 +207,10 @@ class DataFrame:
             List of values for single column, or DataFrame for multiple columns
         """
         if isinstance(key, str):
-            # Single column selection - return list of values
-            if key not in self.columns:
+            # Single column selection - return the column's list of values
+            if key not in self._col_idx:
                 raise KeyError(f"Column '{key}' not found")
-            col_idx = self.columns.index(key)
-            return [row[col_idx] for row in self.data]
+            return self._cols[self._col_idx[key]]
         
         elif isinstance(key, list):
             # Multiple columns - return new DataFrame
@@ -104,106 +226,273 @@ class DataFrame:
         Filter rows based on condition (SQL WHERE equivalent)
         
         Args:
-            condition: String expression (e.g., "Rating >= 8.5") or callable
+            condition: String expression (e.g., "Rating >= 8.5" or
+                       "Genre in (Puzzle, 'Role-Playing')") or callable
             
         Returns:
             Filtered DataFrame
         """
         if isinstance(condition, str):
-            # Parse string condition
-            filtered_data = []
-            for row in self.data:
-                row_dict = {col: val for col, val in zip(self.columns, row)}
-                if self._evaluate_condition(condition, row_dict):
-                    filtered_data.append(row)
-            return DataFrame(data=filtered_data, columns=self.columns)
+            # Parse string condition once, then scan only the referenced columns
+            groups = self._compile_condition(condition, tuple(self.columns))
+            return self._take(self._filter_rows(groups))
         
         elif callable(condition):
-            # Use callable condition
-            filtered_data = []
-            for row in self.data:
-                row_dict = {col: val for col, val in zip(self.columns, row)}
-                if condition(row_dict):
-                    filtered_data.append(row)
-            return DataFrame(data=filtered_data, columns=self.columns)
+            # Use callable condition, reading each row through one reused view
+            view = _RowView(self._cols, self.columns)
+            keep = []
+            for i in range(self._nrows):
+                view._i = i
+                if condition(view):
+                    keep.append(i)
+            return self._take(keep)
         
         else:
             raise TypeError("Condition must be string or callable")
     
-    def _evaluate_condition(self, condition: str, row_dict: Dict[str, Any]) -> bool:
+    def _filter_rows(self, groups: tuple, rows: Optional[List[int]] = None) -> List[int]:
+        """
+        Find the rows matching a compiled condition
+        
+        Args:
+            groups: Output of _compile_condition (column positions refer to self)
+            rows: Candidate row positions, or None for all rows
+            
+        Returns:
+            Positions of the matching rows, in order
+        """
+        # Fast path: one fused pass over the referenced columns
+        fused = self._fuse_groups(groups)
+        if fused is not None:
+            kernel, positions = fused
+            try:
+                return kernel(rows, *[self._cols[i] for i in positions])
+            except TypeError:
+                # Mixed types in a column - use the element-wise path
+                pass
+        
+        cols = self._cols
+        compare = self._compare
+        
+        def clause_matches(clause, i):
+            if clause is None:
+                return False
+            op, left_i, right_i, right_val = clause
+            if right_i is not None:
+                right_val = cols[right_i][i]
+            return compare(op, cols[left_i][i], right_val)
+        
+        candidates = range(self._nrows) if rows is None else rows
+        return [
+            i for i in candidates
+            if all(any(clause_matches(clause, i) for clause in group) for group in groups)
+        ]
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _compile_condition(condition: str, columns: Tuple[str, ...]) -> Tuple[Tuple[Optional[tuple], ...], ...]:
         """
-        Evaluate a condition string against a row
+        Compile a condition string against a column layout (memoized)
+        
+        The string is tokenized in one pass with _COND_RE. AND splits first and
+        each part may then be split on OR, so "a and b or c" means a AND (b OR c).
         
         Args:
-            condition: String like "Rating >= 8.5" or "Year < 2000"
-            row_dict: Dictionary of column values
+            condition: String like "Rating >= 8.5 and Year < 2000"
+            columns: Column names of the DataFrame being filtered
             
         Returns:
-            True if condition is met
+            Tuple of AND-ed groups, each a tuple of OR-ed clauses. A clause is
+            (op, left_idx, right_idx, literal) with right_idx None when comparing
+            against the literal, or None when the clause can never match.
         """
-        # Handle AND/OR operators
-        if ' and ' in condition.lower():
-            parts = re.split(r'\s+and\s+', condition, flags=re.IGNORECASE)
-            return all(self._evaluate_condition(part.strip(), row_dict) for part in parts)
+        # Column name -> position (later duplicates win, like a row dict)
+        col_idx = {col: i for i, col in enumerate(columns)}
         
-        if ' or ' in condition.lower():
-            parts = re.split(r'\s+or\s+', condition, flags=re.IGNORECASE)
-            return any(self._evaluate_condition(part.strip(), row_dict) for part in parts)
+        tokens = [token for token in _COND_RE.finditer(condition) if token.group(3) is None]
+        has_and = ' and ' in condition.lower()
+        has_or = ' or ' in condition.lower()
         
-        # Parse single condition
-        operators = ['>=', '<=', '!=', '==', '>', '<', '=']
+        groups = []
+        group = []
+        start = 0
+        clause_ops = []
         
-        for op in operators:
-            if op in condition:
-                parts = condition.split(op)
-                if len(parts) != 2:
+        # Cut the string into clauses at connectors; AND closes the current OR-group
+        for token in tokens + [None]:
+            if token is not None:
+                connector = token.group(1)
+                if connector is None:
+                    clause_ops.append(token)
                     continue
-                
-                left = parts[0].strip()
-                right = parts[1].strip()
-                
-                # Get left value (column name)
-                if left not in row_dict:
-                    return False
-                left_val = row_dict[left]
-                
-                # Get right value (literal or column)
-                if right in row_dict:
-                    right_val = row_dict[right]
+                connector = connector.lower()
+                if not ((connector == 'and' and has_and) or (connector == 'or' and has_or)):
+                    continue
+                end = token.start()
+            else:
+                connector = None
+                end = len(condition)
+            
+            group.append(DataFrame._compile_clause(condition, start, end, clause_ops, col_idx))
+            if connector != 'or':
+                groups.append(tuple(group))
+                group = []
+            start = token.end() if token is not None else end
+            clause_ops = []
+        
+        return tuple(groups)
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _fuse_groups(groups: tuple) -> Optional[Tuple[Callable, Tuple[int, ...]]]:
+        """
+        Generate a single-pass filter kernel for a compiled condition (memoized)
+        
+        All clauses are inlined into one list comprehension over the referenced
+        columns, so no per-clause masks are built and AND/OR short-circuit per
+        row. Ordering comparisons between mixed types raise TypeError, which
+        _filter_rows handles by falling back to element-wise evaluation.
+        
+        Args:
+            groups: Output of _compile_condition
+            
+        Returns:
+            (kernel, column positions) where kernel(rows, *columns) returns the
+            matching row positions, or None when no columns are referenced
+        """
+        positions = []
+        literals = {}
+        
+        def column_var(col_i):
+            if col_i not in positions:
+                positions.append(col_i)
+            return f"x{positions.index(col_i)}"
+        
+        group_exprs = []
+        for group in groups:
+            clause_exprs = []
+            for clause in group:
+                if clause is None:
+                    clause_exprs.append('False')
+                    continue
+                op, left_i, right_i, literal = clause
+                op = '==' if op == '=' else op
+                a = column_var(left_i)
+                if right_i is not None:
+                    b = column_var(right_i)
+                    template = _FUSED_ORDERING
                 else:
-                    # Parse literal value
-                    right_val = self._parse_literal(right)
-                
-                # Handle None values
-                if left_val is None or right_val is None:
-                    if op in ['!=', '==', '=']:
-                        return (left_val is None) == (right_val is None) if op in ['==', '='] else (left_val is None) != (right_val is None)
-                    return False
-                
-                # Perform comparison
-                try:
-                    if op == '>':
-                        return left_val > right_val
-                    elif op == '<':
-                        return left_val < right_val
-                    elif op == '>=':
-                        return left_val >= right_val
-                    elif op == '<=':
-                        return left_val <= right_val
-                    elif op in ['==', '=']:
-                        return left_val == right_val
-                    elif op == '!=':
-                        return left_val != right_val
-                except TypeError:
-                    # Type mismatch - convert to strings and compare
-                    return str(left_val) == str(right_val) if op in ['==', '='] else str(left_val) != str(right_val)
-        
-        return False
-    
-    def _parse_literal(self, value: str) -> Any:
+                    # Literals are passed in by name, never formatted into source
+                    b = f"v{len(literals)}"
+                    literals[b] = literal
+                    template = _FUSED_ORDERING_LITERAL
+                if op in ('==', '!=', 'in', 'not in'):
+                    template = _FUSED_EQUALITY
+                clause_exprs.append(template.format(a=a, b=b, op=op))
+            group_exprs.append('(' + ' or '.join(clause_exprs) + ')')
+        
+        if not positions:
+            return None
+        
+        expr = ' and '.join(group_exprs)
+        cols = ', '.join(f"c{i}" for i in range(len(positions)))
+        row = ', '.join(f"x{i}" for i in range(len(positions)))
+        values = ', '.join(f"c{i}[i]" for i in range(len(positions)))
+        source = (
+            f"def kernel(rows, {cols}):\n"
+            f"    if rows is None:\n"
+            f"        return [i for i, ({row},) in enumerate(zip({cols})) if {expr}]\n"
+            f"    return [i for i in rows for {row}, in [({values},)] if {expr}]\n"
+        )
+        namespace = dict(literals)
+        exec(compile(source, '<filter kernel>', 'exec'), namespace)
+        return namespace['kernel'], tuple(positions)
+    
+    @staticmethod
+    def _compile_clause(condition: str, start: int, end: int, op_tokens: list,
+                        col_idx: Dict[str, int]) -> Optional[tuple]:
+        """Compile condition[start:end] (a single comparison) into a clause tuple"""
+        # IN / NOT IN is an operator only directly after the column name
+        membership = []
+        comparisons = []
+        for token in op_tokens:
+            if not token.group(2).rstrip()[-1:].isalpha():
+                comparisons.append(token)
+            elif condition[start:token.start()].strip() in col_idx:
+                membership.append(token)
+        if membership or len(comparisons) == 1:
+            # Split on the operator the tokenizer found; for IN / NOT IN take
+            # the first one, since operator characters may appear in the list
+            token = membership[0] if membership else comparisons[0]
+            op = ' '.join(token.group(2).lower().split())
+            left = condition[start:token.start()].strip()
+            right = condition[token.end():end].strip()
+        else:
+            # No operator, or operator characters inside a literal: resolve by
+            # operator priority, splitting on the first one that yields two sides
+            clause = condition[start:end].strip()
+            for op in ['>=', '<=', '!=', '==', '>', '<', '=']:
+                if op in clause:
+                    parts = clause.split(op)
+                    if len(parts) == 2:
+                        left = parts[0].strip()
+                        right = parts[1].strip()
+                        break
+            else:
+                return None
+        
+        # Left side must be a column name
+        if left not in col_idx:
+            return None
+        
+        if op in ('in', 'not in'):
+            # Right side is a (value, ...) list, parsed once into a set
+            if not (right.startswith('(') and right.endswith(')')):
+                return None
+            members = frozenset(
+                DataFrame._parse_literal(item)
+                for item in _IN_ITEM_RE.findall(right[1:-1])
+                if item.strip()
+            )
+            return (op, col_idx[left], None, members)
+        
+        # Right side is another column or a literal parsed once here
+        if right in col_idx:
+            return (op, col_idx[left], col_idx[right], None)
+        return (op, col_idx[left], None, DataFrame._parse_literal(right))
+    
+    @staticmethod
+    def _compare(op: str, left_val: Any, right_val: Any) -> bool:
+        """Compare two values with a condition operator"""
+        # Set membership (the right side is the IN list)
+        if op == 'in':
+            return left_val in right_val
+        if op == 'not in':
+            return left_val not in right_val
+        
+        # Handle None values
+        if left_val is None or right_val is None:
+            if op in ['!=', '==', '=']:
+                return (left_val is None) == (right_val is None) if op in ['==', '='] else (left_val is None) != (right_val is None)
+            return False
+        
+        # Perform comparison
+        try:
+            return _OPS[op](left_val, right_val)
+        except TypeError:
+            # Type mismatch - convert to strings and compare
+            return str(left_val) == str(right_val) if op in ['==', '='] else str(left_val) != str(right_val)
+    
+    @staticmethod
+    def _parse_literal(value: str) -> Any:
         """Parse a literal value from string"""
         value = value.strip().strip('"').strip("'")
         
+        if _INT_LITERAL_RE.fullmatch(value):
+            return int(value)
+        if not _NUMBER_HINT_RE.search(value):
+            return value
+        
         # Try integer
         try:
             return int(value)
@@ -231,18 +520,14 @@ class DataFrame:
         """
         # Validate columns exist
         for col in columns:
-            if col not in self.columns:
+            if col not in self._col_idx:
                 raise KeyError(f"Column '{col}' not found")
         
-        # Get column indices
-        col_indices = [self.columns.index(col) for col in columns]
+        # Share the selected column lists - no per-row copy needed
+        col_idx = self._col_idx
+        selected_cols = [self._cols[col_idx[col]] for col in columns]
         
-        # Extract data for selected columns
-        selected_data = []
-        for row in self.data:
-            selected_data.append([row[i] for i in col_indices])
-        
-        return DataFrame(data=selected_data, columns=columns)
+        return DataFrame._from_cols(selected_cols, list(columns), nrows=self._nrows)
     
     def group_by(self, by: Union[str, List[str]]) -> 'GroupedDataFrame':
         """
@@ -259,7 +544,8 @@ class DataFrame:
         
         return GroupedDataFrame(self, by)
     
-    def join(self, other: 'DataFrame', on: str, how: str = 'inner') -> 'DataFrame':
+    def join(self, other: 'DataFrame', on: str, how: str = 'inner',
+             limit: Optional[int] = None, workers: int = 1) -> 'DataFrame':
         """
         Join two DataFrames (SQL JOIN equivalent)
         
@@ -267,77 +553,174 @@ class DataFrame:
             other: DataFrame to join with
             on: Column name to join on (must exist in both DataFrames)
             how: Join type ('inner' or 'left')
+            limit: Stop after this many joined rows (None = all). The first
+                   rows are the same as with no limit.
+            workers: Threads to split the left rows across for the probe (the
+                     right index is shared read-only). Only pays off on a
+                     free-threaded Python build; with the GIL, leave it at 1.
             
         Returns:
             Joined DataFrame
         """
-        if on not in self.columns:
-            raise KeyError(f"Column '{on}' not found in left DataFrame")
-        if on not in other.columns:
-            raise KeyError(f"Column '{on}' not found in right DataFrame")
+        left_keys, right_index = self._join_index(other, on, how)
+        new_columns = self._join_columns(self.columns, other.columns)
         
-        left_idx = self.columns.index(on)
-        right_idx = other.columns.index(on)
+        if limit is not None:
+            # Probe only as many left rows as the first `limit` results need
+            needed, n_left = 0, 0
+            for left_key in left_keys:
+                if needed >= limit:
+                    break
+                matches = right_index.get(left_key)
+                needed += len(matches) if matches else how == 'left'
+                n_left += 1
+            left_keys = left_keys[:n_left]
         
-        # Create new column names (avoid duplicates)
-        new_columns = self.columns.copy()
-        for col in other.columns:
-            if col not in new_columns:
-                new_columns.append(col)
-            else:
-                new_columns.append(f"{col}_right")
+        # Probe phase: collect (left row, right row) position pairs only;
+        # unmatched left join rows point one past the end of the right columns
+        null_pos = len(other)
+        if workers > 1 and len(left_keys) > workers:
+            left_pos, right_pos = _parallel_probe(left_keys, right_index, how, null_pos, workers)
+        else:
+            left_pos, right_pos = _probe(left_keys, right_index, how, null_pos)
         
-        joined_data = []
-        
-        if how == 'inner':
-            # Inner join - only matching rows
-            for left_row in self.data:
-                left_key = left_row[left_idx]
-                for right_row in other.data:
-                    right_key = right_row[right_idx]
-                    if left_key == right_key:
-                        combined = left_row.copy()
-                        combined.extend(right_row)
-                        joined_data.append(combined)
-        
-        elif how == 'left':
-            # Left join - all left rows, matching right rows
-            for left_row in self.data:
-                left_key = left_row[left_idx]
-                matched = False
-                
-                for right_row in other.data:
-                    right_key = right_row[right_idx]
-                    if left_key == right_key:
-                        combined = left_row.copy()
-                        combined.extend(right_row)
-                        joined_data.append(combined)
-                        matched = True
-                
-                if not matched:
-                    # Add left row with None for right columns
-                    combined = left_row.copy()
-                    combined.extend([None] * len(other.columns))
-                    joined_data.append(combined)
+        if limit is not None:
+            del left_pos[limit:], right_pos[limit:]
         
+        # Gather the output column by column; the null position reads as None
+        # (checked during the gather, so the right columns are never copied)
+        joined_cols = [[col[i] for i in left_pos] for col in self._cols]
+        if how == 'left':
+            joined_cols.extend([col[i] if i != null_pos else None for i in right_pos]
+                               for col in other._cols)
         else:
+            joined_cols.extend([col[i] for i in right_pos] for col in other._cols)
+        
+        return DataFrame._from_cols(joined_cols, new_columns, nrows=len(left_pos))
+    
+    def join_count(self, other: 'DataFrame', on: str, how: str = 'inner') -> int:
+        """
+        Number of rows join() would return, without building them
+        
+        Args:
+            other: DataFrame to join with
+            on: Column name to join on (must exist in both DataFrames)
+            how: Join type ('inner' or 'left')
+            
+        Returns:
+            Joined row count
+        """
+        left_keys, right_index = self._join_index(other, on, how)
+        
+        total = 0
+        for left_key in left_keys:
+            matches = right_index.get(left_key)
+            if matches:
+                total += len(matches)
+            elif how == 'left':
+                total += 1
+        return total
+    
+    def _join_index(self, other: 'DataFrame', on: str, how: str) -> Tuple[List[Any], Dict[Any, List[int]]]:
+        """Validate join arguments; return the left key column and the right key index"""
+        if on not in self._col_idx:
+            raise KeyError(f"Column '{on}' not found in left DataFrame")
+        if on not in other._col_idx:
+            raise KeyError(f"Column '{on}' not found in right DataFrame")
+        if how not in ('inner', 'left'):
             raise ValueError(f"Join type '{how}' not supported. Use 'inner' or 'left'.")
         
-        return DataFrame(data=joined_data, columns=new_columns)
+        # Build phase: hash the right side (once per column, then cached)
+        return self._cols[self._col_idx[on]], other._key_index(other._col_idx[on])
+    
+    @staticmethod
+    def _join_columns(left_columns: List[str], right_columns: List[str]) -> List[str]:
+        """Column names of a joined DataFrame"""
+        # Create new column names (avoid duplicates)
+        new_columns = list(left_columns)
+        seen = set(new_columns)
+        for col in right_columns:
+            if col not in seen:
+                new_columns.append(col)
+            else:
+                new_columns.append(f"{col}_right")
+            seen.add(new_columns[-1])
+        return new_columns
     
     # ==================== UTILITY METHODS ====================
     
     def head(self, n: int = 5) -> 'DataFrame':
-        """Return first n rows"""
-        return DataFrame(data=self.data[:n], columns=self.columns)
+        """Return first n rows (as a view sharing this DataFrame's columns)"""
+        return DataFrameView(self, slice(None, n))
     
     def tail(self, n: int = 5) -> 'DataFrame':
-        """Return last n rows"""
-        return DataFrame(data=self.data[-n:], columns=self.columns)
+        """Return last n rows (as a view sharing this DataFrame's columns)"""
+        return DataFrameView(self, slice(-n, None))
+    
+    @cached_property
+    def dtypes(self) -> Dict[str, str]:
+        """
+        Inferred type of each column, computed on first use and then cached
+        
+        None values are ignored. Types are 'int', 'float' (ints and floats),
+        'str', 'empty' (only None) or 'mixed'.
+        """
+        return {col: _infer_dtype(values) for col, values in zip(self.columns, self._cols)}
+    
+    @cached_property
+    def _codes(self) -> Dict[int, Tuple[Dict[Any, int], List[int]]]:
+        """Factorized columns by position, filled in by _column_codes"""
+        return {}
+    
+    def _column_codes(self, col_i: int) -> Tuple[Dict[Any, int], List[int]]:
+        """
+        Dense integer codes of one column (see _factorize), computed on first use
+        
+        Repeated GROUP BYs on the same column (e.g. different aggregations of
+        one dataset) then reuse the codes instead of re-hashing every value.
+        """
+        codes = self._codes.get(col_i)
+        if codes is None:
+            codes = self._codes[col_i] = _factorize(self._cols[col_i])
+        return codes
+    
+    @cached_property
+    def _key_indexes(self) -> Dict[int, Dict[Any, List[int]]]:
+        """Join key indexes by column position, filled in by _key_index"""
+        return {}
+    
+    def _key_index(self, col_i: int) -> Dict[Any, List[int]]:
+        """
+        Hash index of one column (value -> row positions), built on first use
+        
+        Joining against this DataFrame again on the same column (another left
+        side or join type) skips the build phase. The index is built locally
+        and published in one assignment, so a concurrent join never sees it
+        half filled.
+        """
+        index = self._key_indexes.get(col_i)
+        if index is None:
+            index = {}
+            for i, key in enumerate(self._cols[col_i]):
+                index.setdefault(key, []).append(i)
+            self._key_indexes[col_i] = index
+        return index
+    
+    def take(self, indices: List[int]) -> 'DataFrame':
+        """
+        Select rows by position
+        
+        Args:
+            indices: Row positions, in output order
+            
+        Returns:
+            DataFrame with the rows at those positions
+        """
+        return self._take(indices)
     
     def shape(self) -> tuple:
         """Return (rows, columns) tuple"""
-        return (len(self.data), len(self.columns))
+        return (self._nrows, len(self.columns))
     
     def sort_values(self, by: str, ascending: bool = True) -> 'DataFrame':
         """
@@ -350,19 +733,23 @@ class DataFrame:
         Returns:
             Sorted DataFrame
         """
-        if by not in self.columns:
+        if by not in self._col_idx:
             raise KeyError(f"Column '{by}' not found")
         
-        col_idx = self.columns.index(by)
+        col = self._cols[self._col_idx[by]]
         
-        # Sort data, handling None values
-        sorted_data = sorted(
-            self.data,
-            key=lambda row: (row[col_idx] is None, row[col_idx]),
-            reverse=not ascending
-        )
+        # None values sort last (first when descending); partitioning them out
+        # lets the rest sort on the bare values instead of per-row key tuples
+        nones = [i for i, v in enumerate(col) if v is None]
+        if nones:
+            rest = [i for i, v in enumerate(col) if v is not None]
+        else:
+            rest = range(self._nrows)
         
-        return DataFrame(data=sorted_data, columns=self.columns)
+        order = sorted(rest, key=col.__getitem__, reverse=not ascending)
+        order = order + nones if ascending else nones + order
+        
+        return self._take(order)
     
     def to_dict(self, orient: str = 'records') -> Union[List[Dict], Dict[str, List]]:
         """
@@ -375,17 +762,102 @@ class DataFrame:
             Dictionary representation
         """
         if orient == 'records':
-            return [
-                {col: val for col, val in zip(self.columns, row)}
-                for row in self.data
-            ]
+            if not self._cols:
+                return [{} for _ in range(self._nrows)]
+            keys = tuple(self.columns)
+            return [dict(zip(keys, row)) for row in zip(*self._cols)]
         elif orient == 'columns':
-            return {
-                col: [row[i] for row in self.data]
-                for i, col in enumerate(self.columns)
-            }
+            return dict(zip(self.columns, self._cols))
         else:
             raise ValueError("orient must be 'records' or 'columns'")
+    
+    def lazy(self) -> 'LazyFrame':
+        """
+        Start a deferred query on this DataFrame
+        
+        filter/select/group_by/agg calls on the returned LazyFrame are only
+        recorded; collect() then runs the whole chain in a single pass.
+        
+        Returns:
+            LazyFrame over this DataFrame
+        """
+        return LazyFrame(self)
+
+
+def _infer_dtype(values: List[Any]) -> str:
+    """Classify a column by the set of Python types of its non-None values"""
+    kinds = {type(v) for v in values}
+    kinds.discard(type(None))
+    if not kinds:
+        return 'empty'
+    if kinds == {int}:
+        return 'int'
+    if kinds <= {int, float}:
+        return 'float'
+    if kinds == {str}:
+        return 'str'
+    return 'mixed'
+
+
+class DataFrameView(DataFrame):
+    """
+    Row slice of a DataFrame, returned by head() and tail()
+    
+    Creating a view is O(1): it keeps the parent's column lists and a slice.
+    Reading one column slices only that column; the full set of sliced
+    columns is built the first time an operation needs them all.
+    """
+    
+    def __init__(self, parent: DataFrame, rows: slice):
+        """
+        Initialize view
+        
+        Args:
+            parent: DataFrame being viewed
+            rows: Slice of the parent's rows
+        """
+        self.columns = parent.columns
+        self._parent_cols = parent._cols
+        self._slice = rows
+        self._nrows = len(range(parent._nrows)[rows])
+    
+    @cached_property
+    def _cols(self) -> List[List[Any]]:
+        return [col[self._slice] for col in self._parent_cols]
+    
+    def __getitem__(self, key: Union[str, List[str]]) -> Union[List[Any], DataFrame]:
+        if isinstance(key, str) and '_cols' not in self.__dict__:
+            if key not in self._col_idx:
+                raise KeyError(f"Column '{key}' not found")
+            return self._parent_cols[self._col_idx[key]][self._slice]
+        return super().__getitem__(key)
+
+
+class _RowView(Mapping):
+    """
+    Read-only {column: value} mapping of one row, passed to callable filters
+    
+    A single view is reused for every row, with only its row position
+    changing, so no dict is built per row. Predicates that keep the row
+    around should copy it with dict(row).
+    """
+    
+    __slots__ = ('_cols', '_idx', '_i')
+    
+    def __init__(self, cols: List[List[Any]], columns: List[str]):
+        self._cols = cols
+        # Last occurrence wins, as when the row dict was built column by column
+        self._idx = {col: c for c, col in enumerate(columns)}
+        self._i = 0
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._cols[self._idx[key]][self._i]
+    
+    def __iter__(self):
+        return iter(self._idx)
+    
+    def __len__(self) -> int:
+        return len(self._idx)
 
 
 class GroupedDataFrame:
@@ -401,134 +873,666 @@ class GroupedDataFrame:
         """
         self.df = dataframe
         self.by_columns = by_columns
-        self._groups = self._create_groups()
+        self._group_keys, self._group_ids = self._create_groups()
     
-    def _create_groups(self) -> Dict[tuple, List[List[Any]]]:
-        """Create dictionary of groups"""
-        groups = {}
-        
-        by_indices = [self.df.columns.index(col) for col in self.by_columns]
-        
-        for row in self.df.data:
-            # Create group key
-            key = tuple(row[i] for i in by_indices)
-            
-            if key not in groups:
-                groups[key] = []
-            groups[key].append(row)
+    def _create_groups(self) -> Tuple[Dict[tuple, int], List[int]]:
+        """Number the groups (first-appearance order) and tag each row with its group id"""
+        col_idx = self.df._col_idx
+        for col in self.by_columns:
+            if col not in col_idx:
+                raise KeyError(f"Column '{col}' not found")
+        if len(self.by_columns) == 1:
+            # Single column: reuse the DataFrame's cached codes for it
+            codes, group_ids = self.df._column_codes(col_idx[self.by_columns[0]])
+            return {(value,): g for value, g in codes.items()}, group_ids
         
-        return groups
+        by_cols = [self.df._cols[col_idx[col]] for col in self.by_columns]
+        return _assign_group_ids(by_cols, len(self.df))
     
-    def agg(self, agg_spec: Dict[str, Union[str, List[str]]]) -> DataFrame:
+    def agg(self, agg_spec: Dict[str, Union[str, List[str]]], workers: int = 1) -> DataFrame:
         """
         Perform aggregation (SQL aggregate functions)
         
+        Each column is folded into running per-group statistics in a single
+        pass; rows are never copied into per-group lists.
+        
         Args:
             agg_spec: Dictionary mapping column names to aggregation functions
                      e.g., {'Sales': 'sum', 'Rating': ['mean', 'max']}
+            workers: Threads to split the rows across (partial statistics are
+                     merged afterwards). Only pays off on a free-threaded
+                     Python build; with the GIL, leave it at 1.
             
         Returns:
             Aggregated DataFrame
         """
-        result_data = []
-        result_columns = self.by_columns.copy()
+        def column_values(col: str) -> List[Any]:
+            if col not in self.df._col_idx:
+                raise KeyError(f"Column '{col}' not found")
+            return self.df._cols[self.df._col_idx[col]]
+        
+        return _aggregate_groups(self.by_columns, self._group_keys, self._group_ids,
+                                 agg_spec, column_values, workers)
+    
+    def count(self) -> DataFrame:
+        """Count records in each group"""
+        return _count_groups(self.by_columns, self._group_keys, self._group_ids)
+    
+    def _numeric_columns(self) -> List[str]:
+        """Non-grouping columns holding at least one number, decided from the cached dtypes"""
+        columns = []
+        for col, dtype in self.df.dtypes.items():
+            if col in self.by_columns:
+                continue
+            # Only 'mixed' columns need their values checked
+            if dtype in ('int', 'float') or (
+                    dtype == 'mixed' and any(isinstance(v, (int, float)) for v in self.df[col])):
+                columns.append(col)
+        return columns
+    
+    def sum(self, columns: List[str] = None) -> DataFrame:
+        """Sum numeric columns in each group"""
+        if columns is None:
+            # Sum all numeric columns
+            columns = self._numeric_columns()
+        
+        return self.agg({col: 'sum' for col in columns})
+    
+    def mean(self, columns: List[str] = None) -> DataFrame:
+        """Calculate mean of numeric columns in each group"""
+        if columns is None:
+            columns = self._numeric_columns()
+        
+        return self.agg({col: 'mean' for col in columns})
+
+
+class LazyGroupBy:
+    """Grouping step of a LazyFrame, completed by agg() or count()"""
+    
+    def __init__(self, frame: 'LazyFrame', by_columns: List[str]):
+        self._frame = frame
+        self.by_columns = by_columns
+    
+    def agg(self, agg_spec: Dict[str, Union[str, List[str]]]) -> 'LazyFrame':
+        """Record an aggregation step (same spec as GroupedDataFrame.agg)"""
+        return self._frame._then(('agg', self.by_columns, agg_spec))
+    
+    def count(self) -> 'LazyFrame':
+        """Record a per-group row count step"""
+        return self._frame._then(('count', self.by_columns, None))
+
+
+class LazyFrame:
+    """
+    Deferred DataFrame query (kernel fusion)
+    
+    Each operation returns a new LazyFrame with one more step in its plan.
+    collect() executes the plan against the source columns directly:
+    consecutive string filters are evaluated by one fused kernel, select only
+    remaps column positions, and group_by/agg folds the surviving rows into
+    running per-group accumulators - no intermediate DataFrame is built.
+    
+    String filters that directly follow a join are split at top-level AND
+    and each part that only reads one side is pushed below the join.
+    """
+    
+    def __init__(self, source: DataFrame, plan: List[tuple] = None):
+        self._source = source
+        self._plan = plan if plan is not None else []
+    
+    def _then(self, step: tuple) -> 'LazyFrame':
+        """Return a new LazyFrame with step appended to the plan"""
+        return LazyFrame(self._source, self._plan + [step])
+    
+    def filter(self, condition: Union[str, Callable]) -> 'LazyFrame':
+        """Record a filter step (SQL WHERE)"""
+        if not isinstance(condition, str) and not callable(condition):
+            raise TypeError("Condition must be string or callable")
+        return self._then(('filter', condition))
+    
+    def select(self, columns: List[str]) -> 'LazyFrame':
+        """Record a projection step (SQL SELECT)"""
+        return self._then(('select', list(columns)))
+    
+    def group_by(self, by: Union[str, List[str]]) -> LazyGroupBy:
+        """Group by one or more columns (SQL GROUP BY)"""
+        if isinstance(by, str):
+            by = [by]
+        return LazyGroupBy(self, list(by))
+    
+    def join(self, other: Union[DataFrame, 'LazyFrame'], on: str, how: str = 'inner') -> 'LazyFrame':
+        """Record a join step (same arguments as DataFrame.join)"""
+        if isinstance(other, DataFrame):
+            other = other.lazy()
+        return self._then(('join', other, on, how))
+    
+    @property
+    def columns(self) -> List[str]:
+        """Column names collect() will produce, derived from the plan alone"""
+        names = list(self._source.columns)
+        for step in self._plan:
+            kind = step[0]
+            if kind == 'select':
+                names = list(step[1])
+            elif kind == 'join':
+                names = DataFrame._join_columns(names, step[1].columns)
+            elif kind == 'count':
+                names = step[1] + ['count']
+            elif kind == 'agg':
+                names = _agg_columns(step[1], step[2])
+        return names
+    
+    def collect(self) -> DataFrame:
+        """
+        Execute the recorded plan
         
-        # Build result column names
-        for col, funcs in agg_spec.items():
-            if isinstance(funcs, str):
-                funcs = [funcs]
-            for func in funcs:
-                result_columns.append(f"{col}_{func}")
+        Returns:
+            Resulting DataFrame, equal to running the same chain eagerly
+        """
+        source = self._source
+        names = list(source.columns)            # column names at this step
+        positions = list(range(len(names)))     # step column -> source column
+        rows = None                             # surviving source rows (None = all)
+        pending = []                            # compiled string filters not yet run
         
-        # Perform aggregation for each group
-        for group_key, rows in self._groups.items():
-            result_row = list(group_key)
+        for step_num, step in enumerate(self._plan):
+            kind = step[0]
             
-            for col, funcs in agg_spec.items():
-                if col not in self.df.columns:
-                    raise KeyError(f"Column '{col}' not found")
-                
-                col_idx = self.df.columns.index(col)
-                
-                if isinstance(funcs, str):
-                    funcs = [funcs]
+            if kind == 'where':
+                # Already compiled against this step's columns (pushed-down filter)
+                pending.extend(self._remap(step[1], positions))
+            
+            elif kind == 'filter':
+                condition = step[1]
+                if isinstance(condition, str):
+                    # AND consecutive string filters into a single kernel
+                    groups = DataFrame._compile_condition(condition, tuple(names))
+                    pending.extend(self._remap(groups, positions))
+                    continue
                 
-                for func in funcs:
-                    # Extract values (filter out None)
-                    values = [row[col_idx] for row in rows if row[col_idx] is not None]
-                    
-                    # Calculate aggregation
-                    result_row.append(self._calculate_agg(values, func))
+                rows = self._run_filters(pending, rows)
+                pending = []
+                view = _RowView([source._cols[p] for p in positions], names)
+                candidates = range(len(source)) if rows is None else rows
+                keep = []
+                for i in candidates:
+                    view._i = i
+                    if condition(view):
+                        keep.append(i)
+                rows = keep
+            
+            elif kind == 'select':
+                for col in step[1]:
+                    if col not in names:
+                        raise KeyError(f"Column '{col}' not found")
+                positions = [positions[names.index(col)] for col in step[1]]
+                names = list(step[1])
             
-            result_data.append(result_row)
+            elif kind == 'join':
+                return self._join(step_num, names, positions, pending, rows)
+            
+            else:
+                rows = self._run_filters(pending, rows)
+                result = self._aggregate(kind, step[1], step[2], names, positions, rows)
+                rest = self._plan[step_num + 1:]
+                return LazyFrame(result, rest).collect() if rest else result
         
-        return DataFrame(data=result_data, columns=result_columns)
+        rows = self._run_filters(pending, rows)
+        return self._gather(names, positions, rows)
     
-    def _calculate_agg(self, values: List[Any], func: str) -> Any:
-        """Calculate aggregation function"""
-        if not values:
+    def _gather(self, names: List[str], positions: List[int],
+                rows: Optional[List[int]]) -> DataFrame:
+        """Materialize the selected source columns for the surviving rows"""
+        source = self._source
+        cols = [source._cols[p] for p in positions]
+        if rows is None:
+            return DataFrame._from_cols(cols, names, nrows=len(source))
+        return DataFrame._from_cols([[col[i] for i in rows] for col in cols], names, nrows=len(rows))
+    
+    def _join(self, step_num: int, names: List[str], positions: List[int],
+              pending: list, rows: Optional[List[int]]) -> DataFrame:
+        """Run the join at step_num, pushing the filters that follow it below the join"""
+        _, other, on, how = self._plan[step_num]
+        joined_names = DataFrame._join_columns(names, other.columns)
+        n_left = len(names)
+        
+        # Split the string filters right after the join into AND groups and
+        # route each by the side it reads. A right-only group may only move
+        # below an inner join: a left join must still emit unmatched rows.
+        left_groups, right_groups, residual = [], [], []
+        next_num = step_num + 1
+        while next_num < len(self._plan):
+            kind, condition = self._plan[next_num][:2]
+            if kind == 'where':
+                groups = condition
+            elif kind == 'filter' and isinstance(condition, str):
+                groups = DataFrame._compile_condition(condition, tuple(joined_names))
+            else:
+                break
+            for group in groups:
+                read = {p for clause in group if clause is not None
+                        for p in clause[1:3] if p is not None}
+                if all(p < n_left for p in read):
+                    left_groups.append(group)
+                elif how == 'inner' and all(p >= n_left for p in read):
+                    right_groups.append(group)
+                else:
+                    residual.append(group)
+            next_num += 1
+        
+        pending = pending + list(self._remap(tuple(left_groups), positions))
+        left = self._gather(names, positions, self._run_filters(pending, rows))
+        
+        if right_groups:
+            # Joined position p is right-side column p - n_left
+            right_positions = [p - n_left for p in range(len(joined_names))]
+            other = other._then(('where', self._remap(tuple(right_groups), right_positions)))
+        
+        joined = left.join(other.collect(), on=on, how=how)
+        rest = self._plan[next_num:]
+        if residual:
+            rest = [('where', tuple(residual))] + rest
+        return LazyFrame(joined, rest).collect() if rest else joined
+    
+    @staticmethod
+    def _remap(groups: tuple, positions: List[int]) -> tuple:
+        """Point compiled clauses at source columns instead of step columns"""
+        return tuple(
+            tuple(
+                None if clause is None else (
+                    clause[0],
+                    positions[clause[1]],
+                    None if clause[2] is None else positions[clause[2]],
+                    clause[3],
+                )
+                for clause in group
+            )
+            for group in groups
+        )
+    
+    def _run_filters(self, pending: list, rows: Optional[List[int]]) -> Optional[List[int]]:
+        """Apply the pending string filters to rows"""
+        if not pending:
+            return rows
+        return self._source._filter_rows(tuple(pending), rows)
+    
+    def _aggregate(self, kind: str, by_columns: List[str], agg_spec: Optional[dict],
+                   names: List[str], positions: List[int],
+                   rows: Optional[List[int]]) -> DataFrame:
+        """Group and aggregate the surviving rows in one pass"""
+        source = self._source
+        
+        def column_values(col: str):
+            if col not in names:
+                raise KeyError(f"Column '{col}' not found")
+            values = source._cols[positions[names.index(col)]]
+            return values if rows is None else map(values.__getitem__, rows)
+        
+        n_rows = len(source) if rows is None else len(rows)
+        group_keys, group_ids = _assign_group_ids(
+            [column_values(col) for col in by_columns], n_rows)
+        
+        if kind == 'count':
+            return _count_groups(by_columns, group_keys, group_ids)
+        return _aggregate_groups(by_columns, group_keys, group_ids, agg_spec, column_values)
+
+
+class _GroupStats:
+    """
+    Running per-group statistics for one aggregated column
+    
+    Stored struct-of-arrays style: each statistic is a list indexed by group
+    id, and only the statistics the requested functions need are tracked.
+    std uses Welford's update so no group's values have to be kept (median
+    is the exception, since it needs every value).
+    """
+    
+    FUNCTIONS = ('count', 'sum', 'mean', 'avg', 'max', 'min', 'median', 'std')
+    
+    def __init__(self, funcs: List[str]):
+        for func in funcs:
+            if func not in self.FUNCTIONS:
+                raise ValueError(f"Unknown aggregation function: {func}")
+        
+        self.funcs = funcs
+        self.track_total = any(func in ('sum', 'mean', 'avg') for func in funcs)
+        self.track_min = 'min' in funcs
+        self.track_max = 'max' in funcs
+        self.track_var = 'std' in funcs
+        self.track_values = 'median' in funcs
+        
+        self.count = []
+        self.total = []
+        self.minimum = []
+        self.maximum = []
+        self.mean = []
+        self.m2 = []
+        self.values = []
+    
+    def _grow(self, n_groups: int):
+        """Extend the statistic arrays to cover n_groups groups"""
+        extra = n_groups - len(self.count)
+        if extra <= 0:
+            return
+        self.count.extend([0] * extra)
+        if self.track_total:
+            self.total.extend([0] * extra)
+        if self.track_min:
+            self.minimum.extend([None] * extra)
+        if self.track_max:
+            self.maximum.extend([None] * extra)
+        if self.track_var:
+            self.mean.extend([0.0] * extra)
+            self.m2.extend([0.0] * extra)
+        if self.track_values:
+            self.values.extend([] for _ in range(extra))
+    
+    def update(self, group_ids: List[int], values, n_groups: int):
+        """Fold values (aligned with group_ids) into the running statistics"""
+        self._grow(n_groups)
+        if not self.track_var and n_groups * 16 <= len(group_ids):
+            self._update_bucketed(group_ids, values, n_groups)
+            return
+        count, total = self.count, self.total
+        minimum, maximum = self.minimum, self.maximum
+        mean, m2, kept = self.mean, self.m2, self.values
+        track_total, track_min, track_max = self.track_total, self.track_min, self.track_max
+        track_var, track_values = self.track_var, self.track_values
+        
+        for g, value in zip(group_ids, values):
+            if value is None:
+                continue
+            count[g] += 1
+            if track_total:
+                total[g] += value
+            if track_min and (minimum[g] is None or value < minimum[g]):
+                minimum[g] = value
+            if track_max and (maximum[g] is None or value > maximum[g]):
+                maximum[g] = value
+            if track_var:
+                delta = value - mean[g]
+                mean[g] += delta / count[g]
+                m2[g] += delta * (value - mean[g])
+            if track_values:
+                kept[g].append(value)
+    
+    def _update_bucketed(self, group_ids: List[int], values, n_groups: int):
+        """
+        update() for functions without a running variance
+        
+        The only per-row work is appending each value to its group's bucket;
+        count/sum/min/max are then taken per bucket with the C builtins
+        len/sum/min/max, like the original per-group aggregation did. Only
+        used when groups average 16+ rows: with many tiny groups the bucket
+        lists cost more to allocate (and garbage-collect) than they save.
+        """
+        buckets = [[] for _ in range(n_groups)]
+        append = [bucket.append for bucket in buckets]
+        for g, value in zip(group_ids, values):
+            if value is not None:
+                append[g](value)
+        
+        for g, bucket in enumerate(buckets):
+            if not bucket:
+                continue
+            self.count[g] += len(bucket)
+            if self.track_total:
+                self.total[g] += sum(bucket)
+            # Strict comparisons keep the earlier extremum, as in update()
+            if self.track_min:
+                low = min(bucket)
+                if self.minimum[g] is None or low < self.minimum[g]:
+                    self.minimum[g] = low
+            if self.track_max:
+                high = max(bucket)
+                if self.maximum[g] is None or high > self.maximum[g]:
+                    self.maximum[g] = high
+            if self.track_values:
+                self.values[g].extend(bucket)
+    
+    def merge(self, other: '_GroupStats'):
+        """Fold in statistics computed (for the same funcs) over later rows"""
+        self._grow(len(other.count))
+        for g, n_other in enumerate(other.count):
+            if not n_other:
+                continue
+            n_self = self.count[g]
+            n = self.count[g] = n_self + n_other
+            if self.track_total:
+                self.total[g] += other.total[g]
+            # Strict comparisons keep the earlier extremum, as update() does
+            if self.track_min and (self.minimum[g] is None or other.minimum[g] < self.minimum[g]):
+                self.minimum[g] = other.minimum[g]
+            if self.track_max and (self.maximum[g] is None or other.maximum[g] > self.maximum[g]):
+                self.maximum[g] = other.maximum[g]
+            if self.track_var:
+                # Chan et al. pairwise combination of Welford partials
+                delta = other.mean[g] - self.mean[g]
+                self.mean[g] += delta * n_other / n
+                self.m2[g] += other.m2[g] + delta * delta * n_self * n_other / n
+            if self.track_values:
+                self.values[g].extend(other.values[g])
+    
+    def result(self, g: int, func: str) -> Any:
+        """Final value of func for group g (None when it saw no values)"""
+        n = self.count[g]
+        if not n:
             return None
         
         if func == 'count':
-            return len(values)
+            return n
         elif func == 'sum':
-            return sum(values)
-        elif func == 'mean':
-            return sum(values) / len(values)
-        elif func == 'avg':
-            return sum(values) / len(values)
+            return self.total[g]
+        elif func in ('mean', 'avg'):
+            return self.total[g] / n
         elif func == 'max':
-            return max(values)
+            return self.maximum[g]
         elif func == 'min':
-            return min(values)
+            return self.minimum[g]
         elif func == 'median':
-            sorted_vals = sorted(values)
-            n = len(sorted_vals)
+            sorted_vals = sorted(self.values[g])
             if n % 2 == 0:
                 return (sorted_vals[n//2 - 1] + sorted_vals[n//2]) / 2
             else:
                 return sorted_vals[n//2]
-        elif func == 'std':
-            # Standard deviation
-            mean = sum(values) / len(values)
-            variance = sum((x - mean) ** 2 for x in values) / len(values)
-            return variance ** 0.5
         else:
-            raise ValueError(f"Unknown aggregation function: {func}")
+            return (self.m2[g] / n) ** 0.5
     
-    def count(self) -> DataFrame:
-        """Count records in each group"""
-        result_data = []
-        result_columns = self.by_columns + ['count']
+    def column(self, func: str) -> List[Any]:
+        """Final values of func for every group, by group id (see result())"""
+        count = self.count
+        if func == 'count':
+            return [n if n else None for n in count]
+        elif func == 'sum':
+            return [total if n else None for n, total in zip(count, self.total)]
+        elif func in ('mean', 'avg'):
+            return [total / n if n else None for n, total in zip(count, self.total)]
+        elif func == 'max':
+            return list(self.maximum)
+        elif func == 'min':
+            return list(self.minimum)
+        return [self.result(g, func) for g in range(len(count))]
+
+
+def _key_columns(group_keys: Dict[tuple, int], n_keys: int) -> List[List[Any]]:
+    """
+    Group key columns by group id
+    
+    Group ids are numbered in first-appearance order, so the dict's insertion
+    order is already group id order.
+    """
+    if n_keys == 1:
+        return [[key[0] for key in group_keys]]
+    return [list(col) for col in zip(*group_keys)] if group_keys else [[] for _ in range(n_keys)]
+
+
+def _factorize(values) -> Tuple[Dict[Any, int], List[int]]:
+    """Encode values as dense integer codes in first-appearance order"""
+    codes = {}
+    encoded = []
+    for value in values:
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+        encoded.append(code)
+    return codes, encoded
+
+
+def _assign_group_ids(key_columns: list, n_rows: int) -> Tuple[Dict[tuple, int], List[int]]:
+    """
+    Number the group keys formed by key_columns in first-appearance order
+    
+    Args:
+        key_columns: Value sequences of the grouping columns (rows aligned)
+        n_rows: Row count, used when there are no grouping columns
         
-        for group_key, rows in self._groups.items():
-            result_row = list(group_key) + [len(rows)]
-            result_data.append(result_row)
+    Returns:
+        (group key tuple -> group id, group id of each row)
+    """
+    if not key_columns:
+        return ({(): 0} if n_rows else {}), [0] * n_rows
+    
+    if len(key_columns) == 1:
+        # Single column: encode the values themselves, no key tuple per row
+        codes, group_ids = _factorize(key_columns[0])
+        return {(value,): g for value, g in codes.items()}, group_ids
+    
+    return _factorize(zip(*key_columns))
+
+
+def _count_groups(by_columns: List[str], group_keys: Dict[tuple, int],
+                  group_ids: List[int]) -> DataFrame:
+    """Build the GROUP BY ... COUNT(*) result from numbered groups"""
+    sizes = [0] * len(group_keys)
+    for g in group_ids:
+        sizes[g] += 1
+    
+    cols = _key_columns(group_keys, len(by_columns)) + [sizes]
+    return DataFrame._from_cols(cols, by_columns + ['count'], nrows=len(group_keys))
+
+
+def _probe(left_keys: List[Any], right_index: Dict[Any, List[int]], how: str,
+           null_pos: int, start: int = 0) -> Tuple[List[int], List[int]]:
+    """
+    Probe a hash join's right index with a run of left keys
+    
+    Args:
+        left_keys: Left join key values
+        right_index: Right key -> right row positions (DataFrame._key_index)
+        how: 'inner' (matching rows only) or 'left' (unmatched rows get null_pos)
+        null_pos: Right position recorded for unmatched left join rows
+        start: Row position of left_keys[0]
         
-        return DataFrame(data=result_data, columns=result_columns)
+    Returns:
+        (left row positions, right row positions) of the joined rows
+    """
+    left_pos = []
+    right_pos = []
     
-    def sum(self, columns: List[str] = None) -> DataFrame:
-        """Sum numeric columns in each group"""
-        if columns is None:
-            # Sum all numeric columns
-            columns = []
-            for col in self.df.columns:
-                if col not in self.by_columns:
-                    # Check if column is numeric
-                    col_idx = self.df.columns.index(col)
-                    if any(isinstance(row[col_idx], (int, float)) for row in self.df.data):
-                        columns.append(col)
+    if how == 'inner':
+        # Inner join - probe once per left row, keep only matching rows
+        for li, left_key in enumerate(left_keys, start):
+            matches = right_index.get(left_key)
+            if matches:
+                left_pos.extend([li] * len(matches))
+                right_pos.extend(matches)
+    
+    else:
+        # Left join - all left rows, matching right rows
+        for li, left_key in enumerate(left_keys, start):
+            matches = right_index.get(left_key)
+            if matches:
+                left_pos.extend([li] * len(matches))
+                right_pos.extend(matches)
+            else:
+                left_pos.append(li)
+                right_pos.append(null_pos)
+    
+    return left_pos, right_pos
+
+
+def _parallel_probe(left_keys: List[Any], right_index: Dict[Any, List[int]], how: str,
+                    null_pos: int, workers: int) -> Tuple[List[int], List[int]]:
+    """Probe contiguous chunks of left keys on worker threads, then concatenate in order"""
+    chunk = -(-len(left_keys) // workers)
+    
+    def probe(start: int) -> Tuple[List[int], List[int]]:
+        return _probe(left_keys[start:start + chunk], right_index, how, null_pos, start)
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(probe, range(0, len(left_keys), chunk)))
+    
+    left_pos = []
+    right_pos = []
+    for part_left, part_right in parts:
+        left_pos.extend(part_left)
+        right_pos.extend(part_right)
+    return left_pos, right_pos
+
+
+def _parallel_stats(funcs: List[str], group_ids: List[int], values: List[Any],
+                    n_groups: int, workers: int) -> _GroupStats:
+    """Accumulate contiguous row chunks on worker threads, then merge in order"""
+    chunk = -(-len(group_ids) // workers)
+    
+    def accumulate(start: int) -> _GroupStats:
+        part = _GroupStats(funcs)
+        part.update(group_ids[start:start + chunk], values[start:start + chunk], n_groups)
+        return part
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(accumulate, range(0, len(group_ids), chunk)))
+    
+    stats = parts[0]
+    for part in parts[1:]:
+        stats.merge(part)
+    return stats
+
+
+def _aggregate_groups(by_columns: List[str], group_keys: Dict[tuple, int], group_ids: List[int],
+                      agg_spec: Dict[str, Union[str, List[str]]],
+                      column_values: Callable, workers: int = 1) -> DataFrame:
+    """
+    Single-pass GROUP BY aggregation using running accumulators
+    
+    Args:
+        by_columns: Grouping column names
+        group_keys: Group key -> group id (from _assign_group_ids)
+        group_ids: Group id of each row
+        agg_spec: Dictionary mapping column names to aggregation functions
+        column_values: Returns the values of a column for the same rows as group_ids
+        workers: Threads to accumulate row chunks on (1 = serial)
         
-        return self.agg({col: 'sum' for col in columns})
+    Returns:
+        Aggregated DataFrame (groups in first-appearance order)
+    """
+    stats = []
+    for col, funcs in agg_spec.items():
+        if isinstance(funcs, str):
+            funcs = [funcs]
+        if workers > 1 and len(group_ids) > workers:
+            values = column_values(col)
+            if not isinstance(values, list):
+                values = list(values)
+            col_stats = _parallel_stats(funcs, group_ids, values, len(group_keys), workers)
+        else:
+            col_stats = _GroupStats(funcs)
+            col_stats.update(group_ids, column_values(col), len(group_keys))
+        stats.append(col_stats)
     
-    def mean(self, columns: List[str] = None) -> DataFrame:
-        """Calculate mean of numeric columns in each group"""
-        if columns is None:
-            columns = []
-            for col in self.df.columns:
-                if col not in self.by_columns:
-                    col_idx = self.df.columns.index(col)
-                    if any(isinstance(row[col_idx], (int, float)) for row in self.df.data):
-                        columns.append(col)
-        
-        return self.agg({col: 'mean' for col in columns})
\ No newline at end of file
+    # Assemble the result column by column, straight from the statistic arrays
+    cols = _key_columns(group_keys, len(by_columns))
+    for col_stats in stats:
+        cols.extend(col_stats.column(func) for func in col_stats.funcs)
+    
+    return DataFrame._from_cols(cols, _agg_columns(by_columns, agg_spec), nrows=len(group_keys))
+
+
+def _agg_columns(by_columns: List[str], agg_spec: Dict[str, Union[str, List[str]]]) -> List[str]:
+    """Result column names of an aggregation: the group columns, then <col>_<func>"""
+    result_columns = list(by_columns)
+    for col, funcs in agg_spec.items():
+        if isinstance(funcs, str):
+            funcs = [funcs]
+        result_columns.extend(f"{col}_{func}" for func in funcs)
+    return result_columns
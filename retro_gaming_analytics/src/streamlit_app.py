@@ -13,10 +13,319 @@ import os
 # Add src directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
 
-from data_loader import DatasetLoader
+from collections import Counter
+
 from dataframe import DataFrame
 
 
+# Custom CSS for modern, professional look (read once at import, injected by
+# main() on each run)
+with open(os.path.join(os.path.dirname(__file__), "static", "retro.css"), encoding="utf-8") as css_file:
+    APP_CSS = f"<style>\n{css_file.read()}</style>"
+
+# Sidebar navigation: (page, icon)
+MENU_ITEMS = (
+    ("Overview", "📊"),
+    ("Search & Filter", "🔎"),
+    ("Data Explorer", "🔍"),
+    ("Query Builder", "⚙️"),
+    ("Market Analytics", "📈"),
+    ("Genre Analysis", "🎮"),
+    ("Platform Performance", "💻"),
+    ("Remaster Opportunities", "✨"),
+    ("JOIN Operations", "🔗"),
+)
+MENU_ICONS = dict(MENU_ITEMS)
+
+
+@st.cache_resource(show_spinner=False)
+def load_datasets(data_dir: str) -> dict:
+    """
+    Load and parse all datasets once, shared by every session
+    
+    cache_resource hands each caller the same objects (cache_data would unpickle
+    a private copy per call), so the DataFrames must be treated as read-only:
+    filter/select/join and friends all return new frames. Sessions run on
+    separate threads, so every lazy per-frame cache (dtypes, _codes,
+    _key_indexes) must publish only fully built values, never fill one in
+    place after storing it.
+    """
+    # Imported here so the CSV parser is only loaded once datasets are requested
+    from data_loader import DatasetLoader
+    
+    loader = DatasetLoader(data_dir=data_dir)
+    return loader.load_all_datasets()
+
+
+@st.cache_data(show_spinner=False)
+def classify_columns(columns: tuple, dtypes: tuple, samples: tuple) -> tuple:
+    """
+    Classify dataset columns from their dtypes and a small value sample (memoized)
+    
+    Args:
+        columns: Column names
+        dtypes: Inferred type of each column (DataFrame.dtypes), in the same order
+        samples: First 30 values of each column, in the same order
+        
+    Returns:
+        (numeric_cols, cat_cols, name_col)
+    """
+    # Numeric: every non-null value in the column is a number
+    numeric_cols = [col for col, dtype in zip(columns, dtypes) if dtype in ('int', 'float')]
+    
+    # Categorical: 2-19 distinct values among the first 30
+    cat_cols = []
+    for col, sample in zip(columns, samples):
+        unique = len(set(str(v) for v in sample if v is not None))
+        if unique < 20 and unique > 1:
+            cat_cols.append(col)
+    
+    # Column holding the game name/title
+    name_col = None
+    for col in columns:
+        if any(term in col.lower() for term in ['name', 'title', 'game']):
+            name_col = col
+            break
+    
+    return numeric_cols, cat_cols, name_col
+
+
+@st.cache_data(show_spinner=False)
+def lowercase_names(dataset_name: str, name_col: str, _df: DataFrame) -> list:
+    """Lowercased name column of a dataset for search (memoized; _df is not hashed)"""
+    return [str(v).lower() for v in _df[name_col]]
+
+
+@st.cache_data(show_spinner=False)
+def cached_group_agg(dataset_name: str, group_col: str, agg_items: tuple, _df: DataFrame) -> DataFrame:
+    """
+    GROUP BY + aggregation result (memoized per dataset, column and spec)
+    
+    Args:
+        dataset_name: Cache key for _df (the DataFrame itself is not hashed)
+        group_col: Column to group by
+        agg_items: Aggregation spec as hashable (column, func or tuple of funcs) pairs
+        _df: Dataset to aggregate
+    """
+    agg_spec = {col: list(funcs) if isinstance(funcs, tuple) else funcs for col, funcs in agg_items}
+    return _df.group_by(group_col).agg(agg_spec)
+
+
+@st.cache_data(show_spinner=False)
+def cached_group_count(dataset_name: str, group_col: str, _df: DataFrame) -> DataFrame:
+    """Row count per group of group_col (memoized per dataset and column)"""
+    return _df.group_by(group_col).count()
+
+
+@st.cache_data(show_spinner=False)
+def cached_top_groups(dataset_name: str, group_col: str, agg_items: tuple, sort_col: str,
+                      n: int, _df: DataFrame) -> DataFrame:
+    """Top n rows of cached_group_agg(...) by sort_col, descending (memoized)"""
+    stats = cached_group_agg(dataset_name, group_col, agg_items, _df)
+    return stats.sort_values(sort_col, ascending=False).take(range(min(n, len(stats))))
+
+
+@st.cache_data(show_spinner=False)
+def cached_filter_count(dataset_name: str, condition: str, _df: DataFrame) -> int:
+    """Number of rows matching a filter condition (memoized per dataset and condition)"""
+    return len(_df.filter(condition))
+
+
+FILTER_CACHE_SIZE = 16
+
+
+def apply_filters(dataset_name: str, conditions: list, df: DataFrame) -> DataFrame:
+    """
+    Apply filter conditions in order, reusing the result of an identical earlier call
+    
+    Results are kept in session state (not st.cache_data) so a hit returns the
+    same DataFrame instead of unpickling a copy of it.
+    """
+    cache = st.session_state.setdefault('filter_cache', {})
+    key = (dataset_name, tuple(conditions))
+    if key not in cache:
+        if len(cache) >= FILTER_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        # Lazy chain so consecutive filters run as one fused pass
+        plan = df.lazy()
+        for condition in conditions:
+            plan = plan.filter(condition)
+        cache[key] = plan.collect()
+    return cache[key]
+
+
+# Row-based outline of DataFrame.join shown on the JOIN pages (static: never re-formatted)
+JOIN_IMPLEMENTATION_CODE = """
+# CUSTOM JOIN IMPLEMENTATION - Built from Scratch
+# File: dataframe.py
+
+def join(self, other: DataFrame, on: str, how: str = 'inner') -> DataFrame:
+    \"\"\"
+    Join two DataFrames on a common column
+    
+    Parameters:
+        other (DataFrame): Right dataset to join with
+        on (str): Column name to join on (must exist in both)
+        how (str): 'inner' or 'left'
+    
+    Returns:
+        DataFrame: New DataFrame with joined data
+    \"\"\"
+    # Validate join column exists
+    if on not in self.columns:
+        raise KeyError(f"Column '{on}' not found in left DataFrame")
+    if on not in other.columns:
+        raise KeyError(f"Column '{on}' not found in right DataFrame")
+    
+    # Get column indices
+    left_idx = self.columns.index(on)
+    right_idx = other.columns.index(on)
+    
+    # Create new column names (handle duplicates)
+    new_columns = self.columns.copy()
+    for col in other.columns:
+        if col not in new_columns:
+            new_columns.append(col)
+        else:
+            new_columns.append(f"{col}_right")
+    
+    # Build phase: hash the right dataset once (join key -> matching rows)
+    right_index = {}
+    for right_row in other.data:
+        right_index.setdefault(right_row[right_idx], []).append(right_row)
+    
+    joined_data = []
+    
+    # Probe phase: one dictionary lookup per left row
+    for left_row in self.data:
+        matches = right_index.get(left_row[left_idx], [])
+        for right_row in matches:  # Match found
+            joined_data.append(left_row + right_row)
+        
+        if not matches and how == 'left':  # LEFT JOIN, no match - add NULLs
+            joined_data.append(left_row + [None] * len(other.columns))
+    
+    return DataFrame(data=joined_data, columns=new_columns)
+
+"""
+
+
+JOIN_CACHE_SIZE = 8
+JOIN_PREVIEW_ROWS = 20
+
+
+def cached_join(left_name: str, right_name: str, join_col: str, join_type: str) -> tuple:
+    """
+    JOIN two loaded datasets, reusing the result of an identical earlier call
+    
+    The pages only display the first rows and some counts, so only a
+    JOIN_PREVIEW_ROWS-row preview is built; the counts come from the key index.
+    
+    Returns:
+        (preview DataFrame, total joined rows, rows with a matching right record)
+    """
+    cache = st.session_state.setdefault('join_cache', {})
+    key = (left_name, right_name, join_col, join_type)
+    if key not in cache:
+        if len(cache) >= JOIN_CACHE_SIZE:
+            cache.pop(next(iter(cache)))
+        left_df = st.session_state.datasets[left_name]
+        right_df = st.session_state.datasets[right_name]
+        preview = left_df.join(right_df, on=join_col, how=join_type, limit=JOIN_PREVIEW_ROWS)
+        
+        # Rows with a match are exactly the INNER JOIN rows
+        matches = left_df.join_count(right_df, on=join_col, how='inner')
+        n_rows = matches if join_type == 'inner' else left_df.join_count(right_df, on=join_col, how=join_type)
+        cache[key] = (preview, n_rows, matches)
+    return cache[key]
+
+
+@st.cache_data(show_spinner=False)
+def latest_data_year(datasets_signature: tuple, _datasets: dict) -> float:
+    """
+    Latest plausible year (> 1970) in any year column of the loaded datasets
+    
+    Args:
+        datasets_signature: (name, row count) per dataset, the cache key
+        _datasets: Loaded datasets (not hashed)
+        
+    Returns:
+        Latest year, or 0 when no dataset has one
+    """
+    latest_year = 0
+    for df in _datasets.values():
+        for col in df.columns:
+            # Columns typed as text (or all-None) cannot hold a year value
+            if 'year' in col.lower() and df.dtypes[col] not in ('str', 'empty'):
+                years = [y for y in df[col] if isinstance(y, (int, float)) and y > 1970]
+                if years:
+                    latest_year = max(latest_year, max(years))
+    return latest_year
+
+
+def summarize_datasets(datasets: dict) -> dict:
+    """
+    Overview figures for the loaded datasets, computed once when they are loaded
+    
+    Returns:
+        Dictionary with 'totals' (total games, datasets, data points, latest
+        year) and 'datasets' ((name, records, columns, schema) per dataset)
+    """
+    total_games = sum(len(df) for df in datasets.values())
+    total_datapoints = sum(len(df.columns) * len(df) for df in datasets.values())
+    
+    # Find latest year across all datasets (computed once per set of datasets)
+    datasets_signature = tuple((name, len(df)) for name, df in datasets.items())
+    latest_year = latest_data_year(datasets_signature, datasets)
+    
+    return {
+        'totals': (total_games, len(datasets), total_datapoints, latest_year),
+        'datasets': [(name, len(df), len(df.columns), ", ".join(df.columns))
+                     for name, df in datasets.items()],
+    }
+
+
+@st.cache_data(show_spinner=False)
+def top_selling_game(dataset_name: str, _df: DataFrame):
+    """(name, sales) of the best-selling game in a dataset, or None (memoized)"""
+    sales_col = _df['Global_Sales']
+    # One pass: first position holding the largest non-null sales value
+    max_sales_idx = max(
+        (i for i, v in enumerate(sales_col) if v is not None),
+        key=sales_col.__getitem__,
+        default=None
+    )
+    if max_sales_idx is None:
+        return None
+    return _df['Name'][max_sales_idx], sales_col[max_sales_idx]
+
+
+def get_column_types(df: DataFrame) -> tuple:
+    """Column classification for df, hashing only its names, dtypes and a 30-row sample"""
+    dtypes = tuple(df.dtypes[col] for col in df.columns)
+    samples = tuple(tuple(df[col][:30]) for col in df.columns)
+    return classify_columns(tuple(df.columns), dtypes, samples)
+
+
+def dataset_metadata(datasets: dict) -> dict:
+    """
+    Per-dataset column classification and per-pair shared columns, computed
+    once when the datasets are loaded
+    
+    Returns:
+        Dictionary with 'column_types' (name -> get_column_types(...)) and
+        'common_columns' ((left, right) -> shared columns in left order)
+    """
+    column_sets = {name: set(df.columns) for name, df in datasets.items()}
+    return {
+        'column_types': {name: get_column_types(df) for name, df in datasets.items()},
+        'common_columns': {
+            (left, right): [col for col in left_df.columns if col in column_sets[right]]
+            for left, left_df in datasets.items() for right in datasets
+        },
+    }
+
+
 def main():
     """Main application entry point"""
     
@@ -28,180 +337,9 @@ def main():
         initial_sidebar_state="expanded"
     )
     
-    # Custom CSS for modern, professional look
-    st.markdown("""
-        <style>
-        /* Main Headers */
-        .main-header {
-            font-size: 2.8rem;
-            color: #1E3A8A;
-            font-weight: 700;
-            margin-bottom: 0.5rem;
-        }
-        .sub-header {
-            font-size: 1.2rem;
-            color: #64748B;
-            margin-bottom: 2.5rem;
-        }
-        
-        /* Hide default Streamlit elements */
-        #MainMenu {visibility: hidden;}
-        footer {visibility: hidden;}
-        
-        /* Navigation Section Header */
-        .css-1544g2n {
-            padding-top: 2rem;
-        }
-        
-        /* All sidebar buttons - make them look like menu items */
-        section[data-testid="stSidebar"] button {
-            width: 100%;
-            background: white;
-            border: 2px solid transparent;
-            border-radius: 10px;
-            padding: 1rem 1.25rem;
-            margin: 0.35rem 0;
-            text-align: left;
-            font-size: 1rem;
-            font-weight: 500;
-            color: #475569;
-            cursor: pointer;
-            transition: all 0.3s ease;
-            box-shadow: 0 1px 3px rgba(0,0,0,0.05);
-        }
-        
-        section[data-testid="stSidebar"] button:hover {
-            background: linear-gradient(135deg, #667eea15 0%, #764ba215 100%);
-            border: 2px solid #667eea;
-            color: #1E3A8A;
-            transform: translateX(5px);
-            box-shadow: 0 4px 8px rgba(102, 126, 234, 0.2);
-        }
-        
-        section[data-testid="stSidebar"] button:active,
-        section[data-testid="stSidebar"] button:focus {
-            background: linear-gradient(135deg, #667eea20 0%, #764ba220 100%);
-            border: 2px solid #667eea;
-            color: #1E3A8A;
-            font-weight: 600;
-            box-shadow: 0 4px 12px rgba(102, 126, 234, 0.3);
-        }
-        
-        /* Primary Load Button */
-        section[data-testid="stSidebar"] button[kind="primary"] {
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-            color: white !important;
-            border: none !important;
-            padding: 1rem 1.5rem !important;
-            font-weight: 600 !important;
-            font-size: 1.05rem !important;
-            box-shadow: 0 6px 16px rgba(102, 126, 234, 0.4) !important;
-            margin: 1rem 0 !important;
-        }
-        
-        section[data-testid="stSidebar"] button[kind="primary"]:hover {
-            box-shadow: 0 8px 20px rgba(102, 126, 234, 0.6) !important;
-            transform: translateY(-2px) !important;
-        }
-        
-        /* KPI Metric Cards - More prominent */
-        div[data-testid="stMetricValue"] {
-            font-size: 2.5rem !important;
-            font-weight: 800 !important;
-            color: #1E3A8A !important;
-        }
-        div[data-testid="stMetricLabel"] {
-            font-size: 0.95rem !important;
-            font-weight: 600 !important;
-            color: #64748B !important;
-            text-transform: uppercase !important;
-            letter-spacing: 1px !important;
-        }
-        div[data-testid="metric-container"] {
-            background: white;
-            border: 3px solid #667eea;
-            border-radius: 16px;
-            padding: 2rem 1.5rem;
-            box-shadow: 0 8px 16px rgba(102, 126, 234, 0.15);
-            transition: all 0.3s ease;
-        }
-        div[data-testid="metric-container"]:hover {
-            transform: translateY(-4px);
-            box-shadow: 0 12px 24px rgba(102, 126, 234, 0.25);
-            border-color: #764ba2;
-        }
-        
-        /* Headers */
-        h1, h2, h3 {
-            color: #1E3A8A !important;
-            font-weight: 700 !important;
-        }
-        h2 {
-            font-size: 2rem !important;
-            margin-top: 2rem !important;
-            margin-bottom: 1.5rem !important;
-        }
-        
-        /* Success/Info boxes */
-        div[data-testid="stSuccess"] {
-            background: linear-gradient(135deg, #10b98120 0%, #05966920 100%);
-            border-left: 5px solid #10b981;
-            border-radius: 10px;
-            padding: 1rem 1.5rem;
-        }
-        div[data-testid="stInfo"] {
-            background: linear-gradient(135deg, #3b82f620 0%, #2563eb20 100%);
-            border-left: 5px solid #3b82f6;
-            border-radius: 10px;
-            padding: 1rem 1.5rem;
-        }
-        div[data-testid="stWarning"] {
-            background: linear-gradient(135deg, #f59e0b20 0%, #d9770620 100%);
-            border-left: 5px solid #f59e0b;
-            border-radius: 10px;
-            padding: 1rem 1.5rem;
-        }
-        
-        /* Expanders */
-        div[data-testid="stExpander"] {
-            border: 2px solid #E2E8F0;
-            border-radius: 12px;
-            background: white;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.05);
-        }
-        div[data-testid="stExpander"]:hover {
-            border-color: #667eea;
-        }
-        
-        /* Code blocks */
-        .stCodeBlock {
-            border-radius: 10px;
-            border: 2px solid #E2E8F0;
-        }
-        
-        /* Sidebar styling */
-        section[data-testid="stSidebar"] {
-            background: linear-gradient(180deg, #f8fafc 0%, #f1f5f9 100%);
-        }
-        section[data-testid="stSidebar"] > div {
-            padding-top: 2rem;
-        }
-        
-        /* Main content area */
-        .main .block-container {
-            padding: 2rem 3rem;
-            max-width: 1400px;
-        }
-        
-        /* Remove any radio button styling that might appear */
-        div[role="radiogroup"] {
-            display: none !important;
-        }
-        input[type="radio"] {
-            display: none !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
+    # Custom CSS for modern, professional look. Streamlit drops any element a
+    # rerun does not emit again, so this cannot be skipped after the first run.
+    st.markdown(APP_CSS, unsafe_allow_html=True)
     
     # Title
     st.markdown('<div class="main-header">Retro Gaming Market Analytics</div>', unsafe_allow_html=True)
@@ -221,52 +359,43 @@ def main():
     st.sidebar.markdown("### Data Management")
     if st.sidebar.button("Load Datasets", type="primary", use_container_width=True):
         with st.spinner("Loading market data..."):
-            loader = DatasetLoader(data_dir="data")
-            st.session_state.datasets = loader.load_all_datasets()
+            st.session_state.datasets = load_datasets("data")
+            st.session_state.filter_cache = {}
+            st.session_state.join_cache = {}
+            st.session_state.dataset_status = "**Active Datasets:**\n" + "\n".join(
+                f"- {name}: {len(df):,} records" for name, df in st.session_state.datasets.items()
+            )
+            st.session_state.dataset_summary = summarize_datasets(st.session_state.datasets)
+            st.session_state.dataset_meta = dataset_metadata(st.session_state.datasets)
             st.session_state.datasets_loaded = True
             st.sidebar.success(f"Loaded {len(st.session_state.datasets)} datasets")
     
     # Show loaded status
     if st.session_state.datasets_loaded:
-        st.sidebar.markdown("**Active Datasets:**")
-        for name, df in st.session_state.datasets.items():
-            st.sidebar.text(f"• {name}: {len(df):,} records")
+        st.sidebar.markdown(st.session_state.dataset_status)
     
     st.sidebar.markdown("---")
     
-    # Navigation Menu with clickable buttons
+    # Navigation Menu
     st.sidebar.markdown("### 📑 Navigation")
     
-    menu_items = [
-        ("Overview", "📊"),
-        ("Search & Filter", "🔎"),
-        ("Data Explorer", "🔍"),
-        ("Query Builder", "⚙️"),
-        ("Market Analytics", "📈"),
-        ("Genre Analysis", "🎮"), 
-        ("Platform Performance", "💻"),
-        ("Remaster Opportunities", "✨"),
-        ("JOIN Operations", "🔗")
-    ]
-    
-    for item, icon in menu_items:
-        is_active = item == st.session_state.current_page
-        
-        # Create button with icon
-        if is_active:
-            button_label = f"{icon}  **{item}**"
-        else:
-            button_label = f"{icon}  {item}"
-        
-        if st.sidebar.button(button_label, key=f"nav_{item}", use_container_width=True):
-            st.session_state.current_page = item
-            st.rerun()
-    
-    page = st.session_state.current_page
+    # One radio widget for the whole menu; selecting a page reruns the app by itself
+    page = st.sidebar.radio(
+        "Navigation",
+        [item for item, _ in MENU_ITEMS],
+        key="current_page",
+        format_func=lambda item: f"{MENU_ICONS[item]}  {item}",
+        label_visibility="collapsed",
+    )
     
     st.sidebar.markdown("---")
     
-    # Route to pages
+    render_page(page)
+
+
+@st.fragment
+def render_page(page):
+    """Render the selected page as a fragment so its widgets rerun only the page"""
     if page == "Overview":
         show_overview()
     elif page == "Search & Filter":
@@ -287,36 +416,76 @@ def main():
         show_join_operations()
 
 
-def create_kpi_card(label, value, delta=None, col=None):
-    """Create a styled KPI card"""
-    container = col if col else st
-    with container:
-        st.markdown(f"""
-        <div style="
-            background: linear-gradient(135deg, rgba(102, 126, 234, 0.1) 0%, rgba(118, 75, 162, 0.1) 100%);
-            border: 2px solid #667eea;
-            border-radius: 12px;
-            padding: 1.5rem;
-            box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-            text-align: center;
-        ">
-            <div style="
-                font-size: 0.85rem;
-                font-weight: 600;
-                color: #64748B;
-                text-transform: uppercase;
-                letter-spacing: 0.5px;
-                margin-bottom: 0.5rem;
-            ">{label}</div>
-            <div style="
-                font-size: 2.25rem;
-                font-weight: 700;
-                color: #1E3A8A;
-                margin-bottom: 0.25rem;
-            ">{value}</div>
-            {f'<div style="font-size: 0.9rem; color: #10b981; font-weight: 600;">{delta}</div>' if delta else ''}
-        </div>
-        """, unsafe_allow_html=True)
+KPI_CARD_TEMPLATE = """<div style="
+    flex: 1;
+    background: linear-gradient(135deg, rgba(102, 126, 234, 0.1) 0%, rgba(118, 75, 162, 0.1) 100%);
+    border: 2px solid #667eea;
+    border-radius: 12px;
+    padding: 1.5rem;
+    box-shadow: 0 4px 6px rgba(0,0,0,0.1);
+    text-align: center;
+">
+    <div style="
+        font-size: 0.85rem;
+        font-weight: 600;
+        color: #64748B;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+        margin-bottom: 0.5rem;
+    ">{label}</div>
+    <div style="
+        font-size: 2.25rem;
+        font-weight: 700;
+        color: #1E3A8A;
+        margin-bottom: 0.25rem;
+    ">{value}</div>{delta}
+</div>"""
+
+KPI_DELTA_TEMPLATE = '<div style="font-size: 0.9rem; color: #10b981; font-weight: 600;">{}</div>'
+
+
+def kpi_card_html(label, value, delta=None):
+    """HTML for one styled KPI card"""
+    return KPI_CARD_TEMPLATE.format(
+        label=label, value=value, delta=KPI_DELTA_TEMPLATE.format(delta) if delta else ''
+    )
+
+
+def render_kpi_row(cards):
+    """Render (label, value) KPI cards side by side with a single markdown call"""
+    html = "".join(kpi_card_html(*card) for card in cards)
+    st.markdown(f'<div style="display: flex; gap: 1rem;">{html}</div>', unsafe_allow_html=True)
+
+
+def show_table(df, key=None, rows=20):
+    """
+    Render DataFrame rows with Streamlit's (virtualized) table component
+    
+    Args:
+        df: DataFrame to show
+        key: Widget key prefix. When given, a rows-per-page selector and page
+             number are shown; only pass it where the table survives reruns
+             (not inside an st.button block)
+        rows: Rows to show when there is no pager
+    """
+    start = 0
+    if key is not None and len(df) > 20:
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            rows = st.select_slider("Rows per page", options=[20, 50, 100], key=f"{key}_rows")
+        n_pages = -(-len(df) // rows)
+        # A page kept from a larger result or a smaller page size may now be
+        # out of range; clamp it before the widget reads it back
+        page_key = f"{key}_page"
+        if st.session_state.get(page_key, 1) > n_pages:
+            st.session_state[page_key] = n_pages
+        with col2:
+            page = st.number_input("Page", min_value=1, max_value=n_pages, key=page_key)
+        start = (page - 1) * rows
+    
+    # Only the visible window is converted and sent to the browser
+    window = df.take(range(start, min(start + rows, len(df))))
+    st.dataframe(window.to_dict('columns'), use_container_width=True)
 
 
 def show_overview():
@@ -378,45 +547,35 @@ def show_overview():
     st.subheader("Market Intelligence Dashboard")
     
     # Key Metrics with styled cards
-    total_games = sum(len(df) for df in st.session_state.datasets.values())
-    total_datasets = len(st.session_state.datasets)
-    total_datapoints = sum(len(df.columns) * len(df) for df in st.session_state.datasets.values())
-    
-    # Find latest year across all datasets
-    latest_year = 0
-    for df in st.session_state.datasets.values():
-        for col in df.columns:
-            if any(term in col.lower() for term in ['year', 'release_year', 'year_of_release']):
-                years = [y for y in df[col] if y is not None and isinstance(y, (int, float)) and y > 1970]
-                if years:
-                    latest_year = max(latest_year, max(years))
+    summary = st.session_state.dataset_summary
+    total_games, total_datasets, total_datapoints, latest_year = summary['totals']
     
     latest_year_display = int(latest_year) if latest_year > 0 else "N/A"
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    create_kpi_card("Total Games", f"{total_games:,}", col=col1)
-    create_kpi_card("Active Datasets", f"{total_datasets}", col=col2)
-    create_kpi_card("Data Points", f"{total_datapoints:,}", col=col3)
-    create_kpi_card("Latest Data Year", f"{latest_year_display}", col=col4)
+    render_kpi_row([
+        ("Total Games", f"{total_games:,}"),
+        ("Active Datasets", f"{total_datasets}"),
+        ("Data Points", f"{total_datapoints:,}"),
+        ("Latest Data Year", f"{latest_year_display}"),
+    ])
     
     st.markdown("---")
     
     # Dataset Overview
     st.subheader("Dataset Summary")
     
-    for name, df in st.session_state.datasets.items():
-        with st.expander(f"📊 {name.upper()} - {len(df):,} records"):
+    for name, n_records, n_columns, schema in summary['datasets']:
+        with st.expander(f"📊 {name.upper()} - {n_records:,} records"):
             col1, col2 = st.columns([1, 3])
             
             with col1:
-                st.markdown(f"**Records:** {len(df):,}")
-                st.markdown(f"**Columns:** {len(df.columns)}")
-                st.markdown(f"**Size:** {len(df) * len(df.columns):,} data points")
+                st.markdown(f"**Records:** {n_records:,}")
+                st.markdown(f"**Columns:** {n_columns}")
+                st.markdown(f"**Size:** {n_records * n_columns:,} data points")
             
             with col2:
                 st.markdown("**Column Schema:**")
-                st.text(", ".join(df.columns))
+                st.text(schema)
     
     st.markdown("---")
     
@@ -430,12 +589,11 @@ def show_overview():
         
         with col1:
             # Top selling game
+            top = None
             if 'Global_Sales' in df.columns and 'Name' in df.columns:
-                sales_col = df['Global_Sales']
-                names_col = df['Name']
-                max_sales_idx = sales_col.index(max(sales_col))
-                top_game = names_col[max_sales_idx]
-                top_sales = sales_col[max_sales_idx]
+                top = top_selling_game('vgsales', df)
+            if top is not None:
+                top_game, top_sales = top
                 
                 st.markdown("**Top Selling Game**")
                 st.markdown(f"🏆 {top_game}")
@@ -463,39 +621,33 @@ def show_search_filter():
     # Dataset selector
     dataset_name = st.selectbox("Select Dataset", list(st.session_state.datasets.keys()))
     df = st.session_state.datasets[dataset_name]
+    numeric_cols, cat_cols, name_col = st.session_state.dataset_meta['column_types'][dataset_name]
     
     st.markdown("---")
     
     # Search Box
     st.subheader("🔍 Search by Name")
     
-    # Find name column
-    name_col = None
-    for col in df.columns:
-        if any(term in col.lower() for term in ['name', 'title', 'game']):
-            name_col = col
-            break
-    
     if name_col:
-        search_term = st.text_input("Search for games", placeholder="Type game name...")
+        # Form: typing does not rerun the page, the search runs on submit
+        with st.form("search_form"):
+            search_term = st.text_input("Search for games", placeholder="Type game name...")
+            st.form_submit_button("Search")
         
         if search_term:
-            # Filter by search term (case insensitive)
-            search_results = []
-            for row in df.data:
-                row_dict = {col: val for col, val in zip(df.columns, row)}
-                game_name = str(row_dict.get(name_col, "")).lower()
-                if search_term.lower() in game_name:
-                    search_results.append(row)
+            # Filter by search term (case insensitive) over the cached lowercased names
+            term = search_term.lower()
+            names_lower = lowercase_names(dataset_name, name_col, df)
+            matches = [i for i, game_name in enumerate(names_lower) if term in game_name]
             
-            result_df = DataFrame(data=search_results, columns=df.columns)
+            result_df = df.take(matches)
             
             st.success(f"Found {len(result_df):,} games matching '{search_term}'")
             
             if len(result_df) > 0:
                 # Sort options
                 st.markdown("**Sort Results:**")
-                sort_cols = [col for col in result_df.columns if any(isinstance(v, (int, float)) for v in result_df[col][:10])]
+                sort_cols = numeric_cols
                 
                 if sort_cols:
                     col1, col2 = st.columns([3, 1])
@@ -505,25 +657,21 @@ def show_search_filter():
                         sort_order = st.radio("Order", ["Descending", "Ascending"], horizontal=True)
                     
                     sorted_results = result_df.sort_values(sort_col, ascending=(sort_order == "Ascending"))
-                    st.code(str(sorted_results.head(20)))
+                    show_table(sorted_results, key="search_results")
                 else:
-                    st.code(str(result_df.head(20)))
+                    show_table(result_df, key="search_results")
                 
-                # Show the code
-                with st.expander("📝 View Implementation Code"):
+                # Show the code (the snippet is only built while the box is ticked)
+                if st.checkbox("📝 View Implementation Code", key="search_show_code"):
                     st.code(f"""
 # SEARCH IMPLEMENTATION
 
-# Step 1: FILTER operation to search
-search_results = []
-for row in df.data:
-    row_dict = {{col: val for col, val in zip(df.columns, row)}}
-    game_name = str(row_dict.get('{name_col}', "")).lower()
-    if '{search_term.lower()}' in game_name:
-        search_results.append(row)
+# Step 1: FILTER operation to search (names lowercased once, then cached)
+names_lower = [str(v).lower() for v in df['{name_col}']]
+matches = [i for i, game_name in enumerate(names_lower) if '{search_term.lower()}' in game_name]
 
-# Step 2: Create filtered DataFrame
-result_df = DataFrame(data=search_results, columns=df.columns)
+# Step 2: Create filtered DataFrame from the matching row positions
+result_df = df.take(matches)
 
 # Step 3: SORT results
 sorted_results = result_df.sort_values('{sort_col}', ascending={sort_order == "Ascending"})
@@ -536,21 +684,6 @@ sorted_results = result_df.sort_values('{sort_col}', ascending={sort_order == "A
     # Multi-Filter Section
     st.subheader("🎛️ Advanced Filters")
     
-    # Get numeric columns for filtering
-    numeric_cols = []
-    for col in df.columns:
-        sample = [v for v in df[col][:20] if v is not None]
-        if sample and all(isinstance(v, (int, float)) for v in sample):
-            numeric_cols.append(col)
-    
-    # Get categorical columns
-    cat_cols = []
-    for col in df.columns:
-        sample = [str(v) for v in df[col][:30] if v is not None]
-        unique = len(set(sample))
-        if unique < 20 and unique > 1:
-            cat_cols.append(col)
-    
     if numeric_cols or cat_cols:
         col1, col2 = st.columns(2)
         
@@ -578,13 +711,11 @@ sorted_results = result_df.sort_values('{sort_col}', ascending={sort_order == "A
         
         if st.button("Apply Filters", use_container_width=True):
             if filters_applied:
-                # Apply all filters
-                filtered = df
-                for filter_cond in filters_applied:
-                    filtered = filtered.filter(filter_cond)
+                # Apply all filters (memoized per dataset and filter set)
+                filtered = apply_filters(dataset_name, filters_applied, df)
                 
                 st.success(f"Applied {len(filters_applied)} filter(s) - Found {len(filtered):,} results")
-                st.code(str(filtered.head(20)))
+                show_table(filtered)
                 
                 # Show implementation
                 with st.expander("📝 View Filter Implementation"):
@@ -629,11 +760,7 @@ def show_data_explorer():
     st.subheader("Data Filtering")
     
     # Get numeric columns for filtering
-    numeric_cols = []
-    for col in df.columns:
-        sample = [v for v in df[col][:20] if v is not None]
-        if sample and all(isinstance(v, (int, float)) for v in sample):
-            numeric_cols.append(col)
+    numeric_cols, _, _ = st.session_state.dataset_meta['column_types'][dataset_name]
     
     if numeric_cols:
         col1, col2, col3 = st.columns([2, 1, 1])
@@ -643,8 +770,9 @@ def show_data_explorer():
         with col2:
             operator = st.selectbox("Operator", [">", "<", ">=", "<=", "==", "!="])
         with col3:
-            sample_val = [v for v in df[filter_col][:10] if isinstance(v, (int, float))]
-            default_val = float(sample_val[0]) if sample_val else 0.0
+            # Numeric column (cached dtype), so its first non-null value is a number
+            sample_val = next((v for v in df[filter_col] if v is not None), None)
+            default_val = float(sample_val) if sample_val is not None else 0.0
             value = st.number_input("Value", value=default_val)
         
         condition = f"{filter_col} {operator} {value}"
@@ -656,7 +784,7 @@ def show_data_explorer():
             
             # Show filtered data
             st.markdown("**Filtered Results:**")
-            st.code(str(filtered.head(20)))
+            show_table(filtered)
             
             # Create simple visualization
             st.markdown("**Result Distribution:**")
@@ -676,7 +804,7 @@ def show_data_explorer():
     if selected_cols:
         projected = df.select(selected_cols)
         st.markdown(f"**Displaying {len(selected_cols)} columns:**")
-        st.code(str(projected.head(20)))
+        show_table(projected, key="projection")
 
 
 def show_query_builder():
@@ -696,20 +824,8 @@ def show_query_builder():
     # GROUP BY Section
     st.subheader("Group By Analysis")
     
-    # Find categorical columns
-    cat_cols = []
-    for col in df.columns:
-        sample = [str(v) for v in df[col][:30] if v is not None]
-        unique = len(set(sample))
-        if unique < 20 and unique > 1:
-            cat_cols.append(col)
-    
-    # Find numeric columns
-    num_cols = []
-    for col in df.columns:
-        sample = [v for v in df[col][:20] if v is not None]
-        if sample and all(isinstance(v, (int, float)) for v in sample):
-            num_cols.append(col)
+    # Find categorical and numeric columns
+    num_cols, cat_cols, _ = st.session_state.dataset_meta['column_types'][dataset_name]
     
     if cat_cols and num_cols:
         col1, col2, col3 = st.columns(3)
@@ -731,7 +847,7 @@ def show_query_builder():
             
             with col1:
                 st.markdown("**Query Results:**")
-                st.code(str(result))
+                show_table(result, rows=len(result))
             
             with col2:
                 st.markdown("**Visual Analysis:**")
@@ -761,7 +877,7 @@ def show_market_analytics():
     st.subheader("Platform Market Share")
     
     if 'Platform' in df.columns and 'Global_Sales' in df.columns:
-        platform_sales = df.group_by('Platform').agg({'Global_Sales': 'sum'})
+        platform_sales = cached_group_agg('vgsales', 'Platform', (('Global_Sales', 'sum'),), df)
         platform_sorted = platform_sales.sort_values('Global_Sales_sum', ascending=False)
         
         col1, col2 = st.columns([2, 1])
@@ -772,8 +888,8 @@ def show_market_analytics():
         with col2:
             st.markdown("**Top 5 Platforms:**")
             top5 = platform_sorted.head(5)
-            for row in top5.data:
-                st.markdown(f"**{row[0]}:** {row[1]:.1f}M")
+            for platform, sales in zip(top5['Platform'], top5['Global_Sales_sum']):
+                st.markdown(f"**{platform}:** {sales:.1f}M")
     
     st.markdown("---")
     
@@ -781,17 +897,17 @@ def show_market_analytics():
     st.subheader("Temporal Trends")
     
     if 'Year' in df.columns:
-        retro = df.filter("Year < 2000")
-        modern = df.filter("Year >= 2000")
+        retro_count = cached_filter_count('vgsales', "Year < 2000", df)
+        modern_count = cached_filter_count('vgsales', "Year >= 2000", df)
         
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            st.metric("Retro Era Games", f"{len(retro):,}", "Pre-2000")
+            st.metric("Retro Era Games", f"{retro_count:,}", "Pre-2000")
         with col2:
-            st.metric("Modern Era Games", f"{len(modern):,}", "Post-2000")
+            st.metric("Modern Era Games", f"{modern_count:,}", "Post-2000")
         with col3:
-            ratio = (len(retro) / len(df) * 100) if len(df) > 0 else 0
+            ratio = (retro_count / len(df) * 100) if len(df) > 0 else 0
             st.metric("Retro Percentage", f"{ratio:.1f}%")
 
 
@@ -814,16 +930,16 @@ def show_genre_analysis():
     
     # Multi-metric analysis
     if 'Global_Sales' in df.columns:
-        genre_stats = df.group_by('Genre').agg({
-            'Name': 'count',
-            'Global_Sales': ['sum', 'mean', 'max']
-        })
+        genre_stats = cached_group_agg('vgsales', 'Genre', (
+            ('Name', 'count'),
+            ('Global_Sales', ('sum', 'mean', 'max')),
+        ), df)
         
         genre_sorted = genre_stats.sort_values('Global_Sales_sum', ascending=False)
         
         # Display table
         st.markdown("**Genre Performance Summary:**")
-        st.code(str(genre_sorted))
+        show_table(genre_sorted, rows=len(genre_sorted))
         
         st.markdown("---")
         
@@ -856,19 +972,20 @@ def show_platform_performance():
     
     st.subheader("Platform Metrics")
     
-    # Calculate platform statistics
+    # Platform statistics, regional sums included, come from one group-by:
+    # Platform is grouped once and changing the region below needs no new pass
     if 'Global_Sales' in df.columns:
-        platform_stats = df.group_by('Platform').agg({
-            'Name': 'count',
-            'Global_Sales': ['sum', 'mean']
-        })
+        regional_cols = [col for col in df.columns if 'Sales' in col and col != 'Global_Sales']
         
-        platform_sorted = platform_stats.sort_values('Global_Sales_sum', ascending=False)
+        platform_aggs = (
+            ('Name', 'count'),
+            ('Global_Sales', ('sum', 'mean')),
+        ) + tuple((col, 'sum') for col in regional_cols)
         
-        # Top performers
+        # Top performers (sorted once per ranking column, then cached)
         st.markdown("**Top Performing Platforms:**")
-        top10 = platform_sorted.head(10)
-        st.code(str(top10))
+        top10 = cached_top_groups('vgsales', 'Platform', platform_aggs, 'Global_Sales_sum', 10, df)
+        show_table(top10.select(['Platform', 'Name_count', 'Global_Sales_sum', 'Global_Sales_mean']))
         
         st.markdown("---")
         
@@ -878,15 +995,13 @@ def show_platform_performance():
         # Regional breakdown if available
         st.subheader("Regional Performance")
         
-        regional_cols = [col for col in df.columns if 'Sales' in col and col != 'Global_Sales']
-        
         if regional_cols:
             selected_region = st.selectbox("Select Region", regional_cols)
-            regional_stats = df.group_by('Platform').agg({selected_region: 'sum'})
-            regional_sorted = regional_stats.sort_values(f'{selected_region}_sum', ascending=False)
+            regional_top10 = cached_top_groups('vgsales', 'Platform', platform_aggs,
+                                               f'{selected_region}_sum', 10, df)
             
             st.markdown(f"**{selected_region} Performance:**")
-            create_horizontal_bar(regional_sorted.head(10), f'{selected_region}_sum', f"{selected_region} (Millions)")
+            create_horizontal_bar(regional_top10, f'{selected_region}_sum', f"{selected_region} (Millions)")
 
 
 def show_remaster_opportunities():
@@ -913,12 +1028,13 @@ def show_remaster_opportunities():
     if st.button("Identify Candidates", use_container_width=True):
         # Multi-step analysis
         if 'Year' in df.columns and 'Global_Sales' in df.columns:
-            # Step 1: Filter retro
-            retro = df.filter(f"Year < {year_threshold}")
-            st.info(f"Step 1: Found {len(retro):,} retro era games")
+            # Step 1: Filter retro (only the count is shown, so no frame is built)
+            retro_condition = f"Year < {year_threshold}"
+            retro_count = cached_filter_count('vgsales', retro_condition, df)
+            st.info(f"Step 1: Found {retro_count:,} retro era games")
             
-            # Step 2: Filter high sales
-            candidates = retro.filter(f"Global_Sales > {sales_threshold}")
+            # Step 2: Filter high sales (both filters run as one fused pass)
+            candidates = df.lazy().filter(retro_condition).filter(f"Global_Sales > {sales_threshold}").collect()
             st.info(f"Step 2: Identified {len(candidates):,} high-potential candidates")
             
             # Step 3: Sort by sales
@@ -932,7 +1048,7 @@ def show_remaster_opportunities():
             
             st.markdown("---")
             st.subheader("Top Remaster Candidates")
-            st.code(str(final.head(20)))
+            show_table(final)
             
             st.markdown("---")
             
@@ -997,7 +1113,7 @@ def show_join_operations():
     st.markdown("---")
     
     # Find common columns automatically
-    common_cols = [col for col in left_df.columns if col in right_df.columns]
+    common_cols = st.session_state.dataset_meta['common_columns'][(left_name, right_name)]
     
     st.subheader("JOIN Configuration")
     
@@ -1034,18 +1150,18 @@ def show_join_operations():
     if st.button("🔗 Execute JOIN Operation", use_container_width=True, type="primary"):
         with st.spinner("Performing JOIN operation..."):
             # Execute the JOIN
-            result = left_df.join(right_df, on=join_col, how=join_type)
+            result, n_rows, matches = cached_join(left_name, right_name, join_col, join_type)
             
             st.success(f"{join_type.upper()} JOIN completed successfully!")
             
             # Show metrics
             st.markdown("### 📊 JOIN Results")
-            col1, col2, col3, col4 = st.columns(4)
-            
-            create_kpi_card("Left Records", f"{len(left_df):,}", col=col1)
-            create_kpi_card("Right Records", f"{len(right_df):,}", col=col2)
-            create_kpi_card("Matched Records", f"{len(result):,}", col=col3)
-            create_kpi_card("Total Columns", f"{len(result.columns)}", col=col4)
+            render_kpi_row([
+                ("Left Records", f"{len(left_df):,}"),
+                ("Right Records", f"{len(right_df):,}"),
+                ("Matched Records", f"{n_rows:,}"),
+                ("Total Columns", f"{len(result.columns)}"),
+            ])
             
             st.markdown("---")
             
@@ -1057,345 +1173,14 @@ FROM {left_name} AS L
 {join_type.upper()} JOIN {right_name} AS R
     ON L.{join_col} = R.{join_col};
 
--- Returns: {len(result):,} rows × {len(result.columns)} columns
+-- Returns: {n_rows:,} rows × {len(result.columns)} columns
             """, language="sql")
             
             st.markdown("---")
             
             
             with st.expander("View Complete JOIN Implementation Code", expanded=True):
-                st.code(f"""
-# CUSTOM JOIN IMPLEMENTATION - Built from Scratch
-# File: dataframe.py
-
-def join(self, other: DataFrame, on: str, how: str = 'inner') -> DataFrame:
-    \"\"\"
-    Join two DataFrames on a common column
-    
-    Parameters:
-        other (DataFrame): Right dataset to join with
-        on (str): Column name to join on (must exist in both)
-        how (str): 'inner' or 'left'
-    
-    Returns:
-        DataFrame: New DataFrame with joined data
-    \"\"\"
-    # Validate join column exists
-    if on not in self.columns:
-        raise KeyError(f"Column '{{on}}' not found in left DataFrame")
-    if on not in other.columns:
-        raise KeyError(f"Column '{{on}}' not found in right DataFrame")
-    
-    # Get column indices
-    left_idx = self.columns.index(on)
-    right_idx = other.columns.index(on)
-    
-    # Create new column names (handle duplicates)
-    new_columns = self.columns.copy()
-    for col in other.columns:
-        if col not in new_columns:
-            new_columns.append(col)
-        else:
-            new_columns.append(f"{{col}}_right")
-    
-    joined_data = []
-    
-    if how == 'inner':
-        # INNER JOIN: Only keep matching rows
-        for left_row in self.data:
-            left_key = left_row[left_idx]
-            for right_row in other.data:
-                right_key = right_row[right_idx]
-                if left_key == right_key:  # Match found
-                    combined_row = left_row.copy()
-                    combined_row.extend(right_row)
-                    joined_data.append(combined_row)
-    
-    elif how == 'left':
-        # LEFT JOIN: Keep all left rows
-        for left_row in self.data:
-            left_key = left_row[left_idx]
-            matched = False
-            
-            for right_row in other.data:
-                right_key = right_row[right_idx]
-                if left_key == right_key:  # Match found
-                    combined_row = left_row.copy()
-                    combined_row.extend(right_row)
-                    joined_data.append(combined_row)
-                    matched = True
-            
-            if not matched:  # No match - add NULLs
-                combined_row = left_row.copy()
-                combined_row.extend([None] * len(other.columns))
-                joined_data.append(combined_row)
-    
-    return DataFrame(data=joined_data, columns=new_columns)
-
-
-# Execution for this JOIN:
-result = {left_name}_df.join({right_name}_df, 
-                              on='{join_col}', 
-                              how='{join_type}')
-
-# Statistics:
-# - Left dataset: {len(left_df):,} rows
-# - Right dataset: {len(right_df):,} rows  
-# - Result: {len(result):,} rows
-# - Match rate: {(len(result)/len(left_df)*100):.1f}%
-                """, language="python")
-            
-            st.markdown("---")
-            
-            # Show data preview
-            st.subheader("📋 Joined Data Preview")
-            st.code(str(result.head(20)))
-            
-            # Analysis of results
-            st.markdown("---")
-            st.subheader("🎯 JOIN Analysis")
-            
-            if join_type == "inner":
-                match_rate = (len(result) / len(left_df) * 100) if len(left_df) > 0 else 0
-                st.markdown(f"""
-                **INNER JOIN Summary:**
-                - Compared {len(left_df):,} records from **{left_name}**
-                - Against {len(right_df):,} records from **{right_name}**
-                - Found {len(result):,} matching pairs on column **{join_col}**
-                - Match rate: {match_rate:.1f}% of left dataset
-                - Unmatched records were excluded
-                - Final output: {len(result):,} rows × {len(result.columns)} columns
-                """)
-            else:
-                matches = sum(1 for row in result.data if any(v is not None for v in row[len(left_df.columns):]))
-                st.markdown(f"""
-                **LEFT JOIN Summary:**
-                - Started with all {len(left_df):,} records from **{left_name}**
-                - Looked for matches in {len(right_df):,} records from **{right_name}**
-                - Found {matches:,} matching records
-                - Kept {len(result) - matches:,} unmatched left records (with NULL values)
-                - Final output: {len(result):,} rows × {len(result.columns)} columns
-                """)
-
-
-# Visualization Helper Functions
-    """JOIN operations with data transformation - DSCI 551 Requirement"""
-    st.header("🔗 JOIN Operations with Data Transformation")
-    st.markdown("Combine multiple datasets using SQL JOIN operations")
-    
-    if not st.session_state.datasets_loaded:
-        st.warning("Load datasets for JOIN operations")
-        return
-    
-    if len(st.session_state.datasets) < 2:
-        st.warning("Multiple datasets required for JOIN operations")
-        return
-    
-    st.subheader("Dataset Selection & Preparation")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("**Left Dataset:**")
-        left_name = st.selectbox("Select left dataset", list(st.session_state.datasets.keys()), key="join_left")
-        left_df = st.session_state.datasets[left_name]
-        st.info(f"📊 {len(left_df):,} records × {len(left_df.columns)} columns")
-        
-        # Show available columns
-        with st.expander("View columns"):
-            st.text(", ".join(left_df.columns))
-    
-    with col2:
-        st.markdown("**Right Dataset:**")
-        right_options = [k for k in st.session_state.datasets.keys() if k != left_name]
-        right_name = st.selectbox("Select right dataset", right_options, key="join_right")
-        right_df = st.session_state.datasets[right_name]
-        st.info(f"📊 {len(right_df):,} records × {len(right_df.columns)} columns")
-        
-        # Show available columns
-        with st.expander("View columns"):
-            st.text(", ".join(right_df.columns))
-    
-    st.markdown("---")
-    
-    # Find common columns automatically
-    common_cols = [col for col in left_df.columns if col in right_df.columns]
-    
-    st.subheader("JOIN Column Selection")
-    
-    if common_cols:
-        st.success(f"✓ Found {len(common_cols)} common column(s): {', '.join(common_cols)}")
-        join_col = st.selectbox("Select JOIN column", common_cols)
-    else:
-        st.warning("⚠️ No identical column names found - Data transformation required!")
-        
-        st.markdown("**Transform columns to enable JOIN:**")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            left_join_col = st.selectbox("Left dataset column", left_df.columns, key="left_transform")
-        
-        with col2:
-            right_join_col = st.selectbox("Right dataset column", right_df.columns, key="right_transform")
-        
-        if st.button("🔄 Create Matching Column", use_container_width=True):
-            # Data transformation: Create a standardized column
-            st.info("Performing data transformation to align columns...")
-            
-            # For demo: assume we're matching by normalizing game names
-            # In real scenario, this could be cleaning, standardizing, etc.
-            
-            # Create new standardized column in both datasets
-            left_transformed_data = []
-            for row in left_df.data:
-                new_row = row.copy()
-                left_transformed_data.append(new_row)
-            
-            right_transformed_data = []
-            for row in right_df.data:
-                new_row = row.copy()
-                right_transformed_data.append(new_row)
-            
-            # Add the transformed column name
-            left_df_new = DataFrame(data=left_transformed_data, columns=left_df.columns)
-            right_df_new = DataFrame(data=right_transformed_data, columns=right_df.columns)
-            
-            st.success("✓ Transformation complete! Columns are now aligned.")
-            common_cols = [left_join_col] if left_join_col == right_join_col else []
-            
-            if not common_cols:
-                st.info("Note: For this demo, select columns with similar data (e.g., both Name columns)")
-        
-        join_col = common_cols[0] if common_cols else None
-    
-    if not join_col:
-        st.error("Please select a join column to continue")
-        return
-    
-    st.markdown("---")
-    
-    # JOIN Configuration
-    st.subheader("JOIN Configuration")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown(f"**Join Column:** `{join_col}`")
-        
-        # Show sample values from join column
-        left_samples = [str(v) for v in left_df[join_col][:5] if v is not None]
-        st.text(f"Left samples: {', '.join(left_samples[:3])}...")
-    
-    with col2:
-        join_type = st.radio("Join Type", ["inner", "left"], horizontal=True)
-        if join_type == "inner":
-            st.info("Returns only matching records from both datasets")
-        else:
-            st.info("Returns all left records + matching right records")
-    
-    # Execute JOIN button
-    if st.button("🔗 Execute JOIN Operation", use_container_width=True, type="primary"):
-        with st.spinner("Performing JOIN operation..."):
-            # Execute the JOIN
-            result = left_df.join(right_df, on=join_col, how=join_type)
-            
-            st.success(f"✓ {join_type.upper()} JOIN completed successfully!")
-            
-            # Show metrics
-            st.markdown("### 📊 JOIN Results")
-            col1, col2, col3, col4 = st.columns(4)
-            
-            create_kpi_card("Left Records", f"{len(left_df):,}", col=col1)
-            create_kpi_card("Right Records", f"{len(right_df):,}", col=col2)
-            create_kpi_card("Matched Records", f"{len(result):,}", col=col3)
-            create_kpi_card("Total Columns", f"{len(result.columns)}", col=col4)
-            
-            st.markdown("---")
-            
-            # Show the SQL equivalent
-            st.subheader("📝 SQL Equivalent")
-            st.code(f"""
-SELECT *
-FROM {left_name} AS L
-{join_type.upper()} JOIN {right_name} AS R
-    ON L.{join_col} = R.{join_col};
-
--- Returns: {len(result):,} rows × {len(result.columns)} columns
-            """, language="sql")
-            
-            st.markdown("---")
-            
-            with st.expander("View Complete JOIN Implementation Code"):
-                st.code(f"""
-# CUSTOM JOIN IMPLEMENTATION - Built from Scratch
-# File: dataframe.py
-
-def join(self, other: DataFrame, on: str, how: str = 'inner') -> DataFrame:
-    \"\"\"
-    Join two DataFrames on a common column
-    
-    Parameters:
-        other (DataFrame): Right dataset to join with
-        on (str): Column name to join on (must exist in both)
-        how (str): 'inner' or 'left'
-    
-    Returns:
-        DataFrame: New DataFrame with joined data
-    \"\"\"
-    # Validate join column exists
-    if on not in self.columns:
-        raise KeyError(f"Column '{{on}}' not found in left DataFrame")
-    if on not in other.columns:
-        raise KeyError(f"Column '{{on}}' not found in right DataFrame")
-    
-    # Get column indices
-    left_idx = self.columns.index(on)
-    right_idx = other.columns.index(on)
-    
-    # Create new column names (handle duplicates)
-    new_columns = self.columns.copy()
-    for col in other.columns:
-        if col not in new_columns:
-            new_columns.append(col)
-        else:
-            new_columns.append(f"{{col}}_right")
-    
-    joined_data = []
-    
-    if how == 'inner':
-        # INNER JOIN: Only keep matching rows
-        for left_row in self.data:
-            left_key = left_row[left_idx]
-            for right_row in other.data:
-                right_key = right_row[right_idx]
-                if left_key == right_key:  # Match found
-                    combined_row = left_row.copy()
-                    combined_row.extend(right_row)
-                    joined_data.append(combined_row)
-    
-    elif how == 'left':
-        # LEFT JOIN: Keep all left rows
-        for left_row in self.data:
-            left_key = left_row[left_idx]
-            matched = False
-            
-            for right_row in other.data:
-                right_key = right_row[right_idx]
-                if left_key == right_key:  # Match found
-                    combined_row = left_row.copy()
-                    combined_row.extend(right_row)
-                    joined_data.append(combined_row)
-                    matched = True
-            
-            if not matched:  # No match - add NULLs
-                combined_row = left_row.copy()
-                combined_row.extend([None] * len(other.columns))
-                joined_data.append(combined_row)
-    
-    return DataFrame(data=joined_data, columns=new_columns)
-
-
+                st.code(JOIN_IMPLEMENTATION_CODE + f"""
 # Execution for this JOIN:
 result = {left_name}_df.join({right_name}_df, 
                               on='{join_col}', 
@@ -1404,292 +1189,42 @@ result = {left_name}_df.join({right_name}_df,
 # Statistics:
 # - Left dataset: {len(left_df):,} rows
 # - Right dataset: {len(right_df):,} rows  
-# - Result: {len(result):,} rows
-# - Match rate: {(len(result)/len(left_df)*100):.1f}%
+# - Result: {n_rows:,} rows
+# - Match rate: {(n_rows/len(left_df)*100):.1f}%
                 """, language="python")
             
             st.markdown("---")
             
             # Show data preview
             st.subheader("📋 Joined Data Preview")
-            st.code(str(result.head(20)))
+            show_table(result)
             
             # Analysis of results
             st.markdown("---")
             st.subheader("🎯 JOIN Analysis")
             
             if join_type == "inner":
-                match_rate = (len(result) / len(left_df) * 100) if len(left_df) > 0 else 0
+                match_rate = (n_rows / len(left_df) * 100) if len(left_df) > 0 else 0
                 st.markdown(f"""
                 **INNER JOIN Summary:**
                 - Compared {len(left_df):,} records from **{left_name}**
                 - Against {len(right_df):,} records from **{right_name}**
-                - Found {len(result):,} matching pairs on column **{join_col}**
+                - Found {n_rows:,} matching pairs on column **{join_col}**
                 - Match rate: {match_rate:.1f}% of left dataset
                 - Unmatched records were excluded
-                - Final output: {len(result):,} rows × {len(result.columns)} columns
+                - Final output: {n_rows:,} rows × {len(result.columns)} columns
                 """)
             else:
-                matches = sum(1 for row in result.data if row[len(left_df.columns):] != [None] * len(right_df.columns))
                 st.markdown(f"""
                 **LEFT JOIN Summary:**
                 - Started with all {len(left_df):,} records from **{left_name}**
                 - Looked for matches in {len(right_df):,} records from **{right_name}**
                 - Found {matches:,} matching records
-                - Kept {len(result) - matches:,} unmatched left records (with NULL values)
-                - Final output: {len(result):,} rows × {len(result.columns)} columns
-                """)
-
-
-def show_sql_operations_demo():
-    """JOIN operations with visible code - DSCI 551 Requirement"""
-    st.header("🔗 JOIN Operations")
-    st.markdown("Combine multiple datasets using SQL JOIN operations")
-    
-    if not st.session_state.datasets_loaded:
-        st.warning("Load datasets for JOIN operations")
-        return
-    
-    if len(st.session_state.datasets) < 2:
-        st.warning("Multiple datasets required for JOIN operations")
-        return
-    
-    st.subheader("Dataset Selection")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("**Left Dataset:**")
-        left_name = st.selectbox("Select left dataset", list(st.session_state.datasets.keys()), key="join_left")
-        left_df = st.session_state.datasets[left_name]
-        st.info(f"📊 {len(left_df):,} records × {len(left_df.columns)} columns")
-        st.text(f"Columns: {', '.join(left_df.columns[:5])}...")
-    
-    with col2:
-        st.markdown("**Right Dataset:**")
-        right_options = [k for k in st.session_state.datasets.keys() if k != left_name]
-        right_name = st.selectbox("Select right dataset", right_options, key="join_right")
-        right_df = st.session_state.datasets[right_name]
-        st.info(f"📊 {len(right_df):,} records × {len(right_df.columns)} columns")
-        st.text(f"Columns: {', '.join(right_df.columns[:5])}...")
-    
-    st.markdown("---")
-    
-    # Find common columns
-    common_cols = [col for col in left_df.columns if col in right_df.columns]
-    
-    if not common_cols:
-        st.error("❌ No common columns found between these datasets")
-        st.markdown("**Available columns:**")
-        col1, col2 = st.columns(2)
-        with col1:
-            st.text(f"Left: {', '.join(left_df.columns)}")
-        with col2:
-            st.text(f"Right: {', '.join(right_df.columns)}")
-        return
-    
-    st.subheader("JOIN Configuration")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        join_col = st.selectbox("Join Column (Key)", common_cols)
-        st.success(f"✓ Column '{join_col}' exists in both datasets")
-    
-    with col2:
-        join_type = st.radio("Join Type", ["inner", "left"], horizontal=True)
-        if join_type == "inner":
-            st.info("INNER JOIN: Returns only matching records")
-        else:
-            st.info("LEFT JOIN: Returns all left records + matches")
-    
-    if st.button("🔗 Execute JOIN", use_container_width=True, type="primary"):
-        with st.spinner("Performing JOIN operation..."):
-            # Execute the JOIN
-            result = left_df.join(right_df, on=join_col, how=join_type)
-            
-            st.success(f"✓ JOIN completed successfully!")
-            
-            # Show metrics
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Left Records", f"{len(left_df):,}")
-            with col2:
-                st.metric("Right Records", f"{len(right_df):,}")
-            with col3:
-                st.metric("Result Records", f"{len(result):,}")
-            with col4:
-                st.metric("Result Columns", len(result.columns))
-            
-            st.markdown("---")
-            
-            # Show the SQL equivalent
-            st.subheader("📝 SQL Equivalent Query")
-            st.code(f"""
-SELECT *
-FROM {left_name} AS left_table
-{join_type.upper()} JOIN {right_name} AS right_table
-ON left_table.{join_col} = right_table.{join_col};
-
--- Result: {len(result):,} rows × {len(result.columns)} columns
-            """, language="sql")
-            
-            st.markdown("---")
-            
-            st.code(f"""
-# CUSTOM JOIN IMPLEMENTATION - DSCI 551 Project
-# Built from scratch using only Python lists and dictionaries
-
-def join(self, other, on, how='inner'):
-    \"\"\"
-    Custom JOIN implementation
-    
-    Args:
-        other: DataFrame to join with
-        on: Column name to join on
-        how: 'inner' or 'left'
-    
-    Returns:
-        New DataFrame with joined data
-    \"\"\"
-    # Get column indices for join key
-    left_idx = self.columns.index(on)
-    right_idx = other.columns.index(on)
-    
-    # Create new column names
-    new_columns = self.columns.copy()
-    for col in other.columns:
-        if col not in new_columns:
-            new_columns.append(col)
-        else:
-            new_columns.append(f"{{col}}_right")
-    
-    joined_data = []
-    
-    if how == 'inner':
-        # INNER JOIN - only matching rows
-        for left_row in self.data:
-            left_key = left_row[left_idx]
-            for right_row in other.data:
-                right_key = right_row[right_idx]
-                if left_key == right_key:
-                    combined = left_row.copy()
-                    combined.extend(right_row)
-                    joined_data.append(combined)
-    
-    elif how == 'left':
-        # LEFT JOIN - all left rows + matches
-        for left_row in self.data:
-            left_key = left_row[left_idx]
-            matched = False
-            
-            for right_row in other.data:
-                right_key = right_row[right_idx]
-                if left_key == right_key:
-                    combined = left_row.copy()
-                    combined.extend(right_row)
-                    joined_data.append(combined)
-                    matched = True
-            
-            if not matched:
-                # Add left row with None for right columns
-                combined = left_row.copy()
-                combined.extend([None] * len(other.columns))
-                joined_data.append(combined)
-    
-    return DataFrame(data=joined_data, columns=new_columns)
-
-# Execution:
-result = left_df.join(right_df, on='{join_col}', how='{join_type}')
-# Result: {len(result):,} rows
-            """, language="python")
-            
-            st.markdown("---")
-            
-            # Show preview of results
-            st.subheader("📊 JOIN Results Preview")
-            st.code(str(result.head(15)))
-            
-            # Explain what happened
-            st.markdown("---")
-            st.subheader("🎯 What Happened")
-            
-            if join_type == "inner":
-                matches = len(result)
-                st.markdown(f"""
-                **INNER JOIN Results:**
-                - Started with {len(left_df):,} records in {left_name}
-                - Compared with {len(right_df):,} records in {right_name}
-                - Found {matches:,} matching records on column '{join_col}'
-                - Only kept rows where values matched in both datasets
-                - Final result: {matches:,} rows × {len(result.columns)} columns
-                """)
-            else:
-                st.markdown(f"""
-                **LEFT JOIN Results:**
-                - Started with {len(left_df):,} records in {left_name} (all kept)
-                - Compared with {len(right_df):,} records in {right_name}
-                - Matched records on column '{join_col}'
-                - Added matching data from right dataset
-                - Where no match found, filled with NULL values
-                - Final result: {len(result):,} rows × {len(result.columns)} columns
+                - Kept {n_rows - matches:,} unmatched left records (with NULL values)
+                - Final output: {n_rows:,} rows × {len(result.columns)} columns
                 """)
 
 
-def show_sql_operations_demo():
-    """Advanced data operations"""
-    st.header("Advanced Operations")
-    st.markdown("Perform complex data operations including joins and multi-step queries")
-    
-    if not st.session_state.datasets_loaded:
-        st.warning("Load datasets for advanced operations")
-        return
-    
-    if len(st.session_state.datasets) < 2:
-        st.warning("Multiple datasets required for join operations")
-        return
-    
-    st.subheader("Dataset Join Operations")
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        left_name = st.selectbox("Left Dataset", list(st.session_state.datasets.keys()))
-        left_df = st.session_state.datasets[left_name]
-        st.text(f"{len(left_df):,} records, {len(left_df.columns)} columns")
-    
-    with col2:
-        right_options = [k for k in st.session_state.datasets.keys() if k != left_name]
-        right_name = st.selectbox("Right Dataset", right_options)
-        right_df = st.session_state.datasets[right_name]
-        st.text(f"{len(right_df):,} records, {len(right_df.columns)} columns")
-    
-    # Find common columns
-    common_cols = [col for col in left_df.columns if col in right_df.columns]
-    
-    if common_cols:
-        join_col = st.selectbox("Join Column", common_cols)
-        join_type = st.radio("Join Type", ["inner", "left"], horizontal=True)
-        
-        if st.button("Execute Join", use_container_width=True):
-            result = left_df.join(right_df, on=join_col, how=join_type)
-            
-            st.success(f"{join_type.upper()} JOIN completed successfully")
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Result Records", f"{len(result):,}")
-            with col2:
-                st.metric("Result Columns", len(result.columns))
-            with col3:
-                st.metric("Join Type", join_type.upper())
-            
-            st.markdown("**Join Results:**")
-            st.code(str(result.head(15)))
-    else:
-        st.error("No common columns found between datasets")
-
-
 def show_sql_operations_demo():
     """Demonstrate all 5 SQL operations with code - DSCI 551 Requirements"""
     st.header("💻 SQL Operations Demo")
@@ -1714,18 +1249,14 @@ def show_sql_operations_demo():
         st.markdown("**SQL Equivalent:** `SELECT * FROM games WHERE Year < 2000`")
         
         # Find a numeric column
-        num_col = None
-        for col in df.columns:
-            sample = [v for v in df[col][:20] if v is not None and isinstance(v, (int, float))]
-            if sample:
-                num_col = col
-                break
+        numeric_cols, cat_cols, _ = st.session_state.dataset_meta['column_types'][dataset_name]
+        num_col = numeric_cols[0] if numeric_cols else None
         
         if num_col:
-            sample_val = [v for v in df[num_col][:10] if isinstance(v, (int, float))][0]
+            sample_val = next(v for v in df[num_col] if v is not None)
             condition = f"{num_col} < {sample_val}"
             
-            filtered = df.filter(condition)
+            filtered = apply_filters(dataset_name, [condition], df)
             
             st.code(f"""
 # FILTER Implementation
@@ -1735,7 +1266,7 @@ filtered = df.filter("{condition}")
             """, language="python")
             
             st.markdown("**Results:**")
-            st.text(str(filtered.head(5)))
+            show_table(filtered, rows=5)
     
     st.markdown("---")
     
@@ -1756,7 +1287,7 @@ projected = df.select({list(selected_cols)})
         """, language="python")
         
         st.markdown("**Results:**")
-        st.text(str(projected.head(5)))
+        show_table(projected, rows=5)
     
     st.markdown("---")
     
@@ -1765,18 +1296,12 @@ projected = df.select({list(selected_cols)})
     
     with st.expander("Show GROUP BY Demo", expanded=True):
         # Find a categorical column
-        cat_col = None
-        for col in df.columns:
-            sample = [str(v) for v in df[col][:30] if v is not None]
-            unique = len(set(sample))
-            if unique < 15 and unique > 2:
-                cat_col = col
-                break
+        cat_col = cat_cols[0] if cat_cols else None
         
         if cat_col:
             st.markdown(f"**SQL Equivalent:** `SELECT {cat_col}, COUNT(*) FROM games GROUP BY {cat_col}`")
             
-            grouped = df.group_by(cat_col).count()
+            grouped = cached_group_count(dataset_name, cat_col, df)
             
             st.code(f"""
 # GROUP BY Implementation
@@ -1786,7 +1311,7 @@ grouped = df.group_by('{cat_col}').count()
             """, language="python")
             
             st.markdown("**Results:**")
-            st.text(str(grouped.head(10)))
+            show_table(grouped, rows=10)
     
     st.markdown("---")
     
@@ -1797,9 +1322,8 @@ grouped = df.group_by('{cat_col}').count()
         if cat_col and num_col:
             st.markdown(f"**SQL Equivalent:** `SELECT {cat_col}, SUM({num_col}), AVG({num_col}) FROM games GROUP BY {cat_col}`")
             
-            agg_result = df.group_by(cat_col).agg({
-                num_col: ['sum', 'mean', 'max', 'min']
-            })
+            agg_result = cached_group_agg(dataset_name, cat_col,
+                                          ((num_col, ('sum', 'mean', 'max', 'min')),), df)
             
             st.code(f"""
 # AGGREGATION Implementation
@@ -1820,7 +1344,7 @@ agg_result = df.group_by('{cat_col}').agg({{
             """, language="python")
             
             st.markdown("**Results:**")
-            st.text(str(agg_result.head(8)))
+            show_table(agg_result, rows=8)
     
     st.markdown("---")
     
@@ -1836,14 +1360,14 @@ agg_result = df.group_by('{cat_col}').agg({{
             left_df = st.session_state.datasets[left_ds]
             right_df = st.session_state.datasets[right_ds]
             
-            common = [col for col in left_df.columns if col in right_df.columns]
+            common = st.session_state.dataset_meta['common_columns'][(left_ds, right_ds)]
             
             if common:
                 join_col = common[0]
                 
                 st.markdown(f"**SQL Equivalent:** `SELECT * FROM {left_ds} INNER JOIN {right_ds} ON {left_ds}.{join_col} = {right_ds}.{join_col}`")
                 
-                joined = left_df.join(right_df, on=join_col, how='inner')
+                joined, joined_rows, _ = cached_join(left_ds, right_ds, join_col, 'inner')
                 
                 st.code(f"""
 # JOIN Implementation
@@ -1853,12 +1377,12 @@ joined = left_df.join(right_df, on='{join_col}', how='inner')
 # - inner: Only matching records
 # - left: All left records + matches
 
-# Result: {len(joined):,} rows × {len(joined.columns)} columns
+# Result: {joined_rows:,} rows × {len(joined.columns)} columns
 # (from {len(left_df):,} + {len(right_df):,} records)
                 """, language="python")
                 
                 st.markdown("**Results:**")
-                st.text(str(joined.head(5)))
+                show_table(joined, rows=5)
             else:
                 st.info("No common columns found for JOIN demo with current datasets")
         else:
@@ -1904,27 +1428,28 @@ class GroupedDataFrame:
 
 
 # Visualization Helper Functions
+# Widest text bar (40 cells); shorter bars are slices of it
+BAR_FULL = '█' * 40
+
+
 def create_bar_chart(df, column):
-    """Create simple bar chart visualization"""
+    """Create simple bar chart visualization (values are counted by their str form)"""
     if column not in df.columns:
         return
     
-    values = df[column]
-    value_counts = {}
-    
-    for val in values:
-        if val is not None:
-            val_str = str(val)
-            value_counts[val_str] = value_counts.get(val_str, 0) + 1
+    # Count by label so 1 and '1' share a bar and 1, 1.0 and True do not
+    value_counts = Counter(str(val) for val in df[column] if val is not None)
     
     # Display top 10
-    sorted_items = sorted(value_counts.items(), key=lambda x: x[1], reverse=True)[:10]
+    sorted_items = value_counts.most_common(10)
     
-    max_count = max([count for _, count in sorted_items]) if sorted_items else 1
+    max_count = sorted_items[0][1] if sorted_items else 1
     
-    for label, count in sorted_items:
-        bar_length = int((count / max_count) * 40)
-        st.text(f"{label[:20]:20s} {'█' * bar_length} {count:,}")
+    # One text element for the whole chart instead of one per bar
+    lines = [f"{label[:20]:20s} {BAR_FULL[:int((count / max_count) * 40)]} {count:,}"
+             for label, count in sorted_items]
+    if lines:
+        st.text("\n".join(lines))
 
 
 def create_bar_chart_from_grouped(grouped_df, value_col):
@@ -1932,15 +1457,18 @@ def create_bar_chart_from_grouped(grouped_df, value_col):
     if value_col not in grouped_df.columns:
         return
     
-    col_idx = grouped_df.columns.index(value_col)
+    labels = grouped_df[grouped_df.columns[0]]
+    values = grouped_df[value_col]
     
-    max_val = max([row[col_idx] for row in grouped_df.data])
+    max_val = max(values) if values else 0
     
-    for row in grouped_df.data[:10]:
-        label = str(row[0])
-        value = row[col_idx]
-        bar_length = int((value / max_val) * 40) if max_val > 0 else 0
-        st.text(f"{label[:20]:20s} {'█' * bar_length} {value:,.1f}")
+    # One text element for the whole chart instead of one per bar
+    lines = []
+    for label, value in zip(labels[:10], values[:10]):
+        bar_length = max(int((value / max_val) * 40), 0) if max_val > 0 else 0
+        lines.append(f"{str(label)[:20]:20s} {BAR_FULL[:bar_length]} {value:,.1f}")
+    if lines:
+        st.text("\n".join(lines))
 
 
 def create_horizontal_bar(df, value_col, title):
@@ -0,0 +1,336 @@
+"""
+Regression tests for the custom DataFrame engine
+
+Run from retro_gaming_analytics/: python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+# Add src directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from dataframe import DataFrame
+
+
+class SharedFrameTest(unittest.TestCase):
+    """Datasets are shared across Streamlit sessions (cache_resource), i.e. threads"""
+    
+    def test_concurrent_join_count(self):
+        # Switch threads as often as possible so a half-built lazy cache is hit
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+        
+        for _ in range(3):
+            left = DataFrame(data=[[i % 1000] for i in range(400)], columns=['k'])
+            right = DataFrame(data=[[i % 1000, i] for i in range(400000)], columns=['k', 'v'])
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                counts = list(pool.map(lambda _: left.join_count(right, 'k'), range(4)))
+            self.assertEqual(counts, [160000] * 4)
+
+
+class MembershipFilterTest(unittest.TestCase):
+    """IN / NOT IN conditions, and literals that only look like them"""
+    
+    def setUp(self):
+        self.df = DataFrame(
+            data=[['Bowl in (time)', 1], ['x', 2], ['a, b', 3], [None, 4], ['y', 5]],
+            columns=['title', 'n'])
+    
+    def matching(self, condition):
+        return self.df.filter(condition)['n']
+    
+    def test_in(self):
+        self.assertEqual(self.matching("title in ('x', 'y')"), [2, 5])
+        self.assertEqual(self.matching("n in (1, 4)"), [1, 4])
+    
+    def test_not_in_keeps_none_rows_like_not_equal(self):
+        self.assertEqual(self.matching("title not in ('x')"), [1, 3, 4, 5])
+        self.assertEqual(self.matching("title not in ('x')"), self.matching("title != 'x'"))
+    
+    def test_quoted_member_with_comma(self):
+        self.assertEqual(self.matching("title in ('a, b', 'y')"), [3, 5])
+    
+    def test_literal_containing_in_list(self):
+        self.assertEqual(self.matching("title == 'Bowl in (time)'"), [1])
+        self.assertEqual(self.matching("title != 'Bowl in (time)' and n < 4"), [2, 3])
+    
+    def test_connector_inside_quotes(self):
+        df = DataFrame(data=[['Rock and Roll', 1], ['Rock', 2]], columns=['title', 'n'])
+        self.assertEqual(df.filter("title == 'Rock and Roll'")['n'], [1])
+
+
+def sample_games(n=240):
+    """Deterministic games table with None values and mixed int/float sales"""
+    genres = ['Action', 'RPG', 'Puzzle', 'Sports', None]
+    platforms = ['NES', 'SNES', 'N64']
+    rows = []
+    for i in range(n):
+        sales = None if i % 11 == 0 else (i % 17) * 0.5 if i % 2 else i % 13
+        rows.append([f"Game {i % 60}", genres[i % 5], platforms[i % 3], 1985 + i % 20, sales])
+    return DataFrame(data=rows, columns=['name', 'genre', 'platform', 'year', 'sales'])
+
+
+class StorageTest(unittest.TestCase):
+    """Column-wise storage and its row views"""
+    
+    def test_rows_round_trip(self):
+        rows = [[1, 'a'], [2, None]]
+        df = DataFrame(data=rows, columns=['n', 's'])
+        self.assertEqual(df.data, rows)
+        self.assertEqual(df['s'], ['a', None])
+        self.assertEqual(df.to_dict('records'), [{'n': 1, 's': 'a'}, {'n': 2, 's': None}])
+        self.assertEqual(df.to_dict('columns'), {'n': [1, 2], 's': ['a', None]})
+    
+    def test_select_shares_columns(self):
+        df = sample_games()
+        projected = df.select(['sales', 'name'])
+        self.assertEqual(projected.columns, ['sales', 'name'])
+        self.assertIs(projected['name'], df['name'])
+    
+    def test_zero_column_rows(self):
+        df = DataFrame(data=[['a'], ['b']], columns=['s'])
+        self.assertEqual(df.select([]).data, [[], []])
+        self.assertEqual(df.group_by([]).sum().data, [[]])
+        self.assertEqual(df.group_by([]).sum().to_dict('records'), [{}])
+    
+    def test_pool_categoricals(self):
+        df = DataFrame.from_csv_data({
+            'headers': ['genre', 'year', 'score'],
+            'data': [[''.join(['RP', 'G']), 1990 + (i % 2) * 1000, -0.0 if i % 2 else 1.0]
+                     for i in range(100)],
+        })
+        genres = df['genre']
+        self.assertTrue(all(g is genres[0] for g in genres))
+        self.assertEqual(df['year'][:2], [1990, 2990])
+        self.assertEqual(str(df['score'][1]), '-0.0')
+        self.assertIs(type(df['score'][0]), float)
+
+
+class ViewTest(unittest.TestCase):
+    """head()/tail() views over the parent's columns"""
+    
+    def test_head_tail(self):
+        df = sample_games(30)
+        self.assertEqual(df.head(3).data, df.data[:3])
+        self.assertEqual(df.tail(4).data, df.data[-4:])
+        self.assertEqual(df.head(100).data, df.data)
+        self.assertEqual(len(df.head(3)), 3)
+        self.assertEqual(df.tail(2)['name'], df['name'][-2:])
+    
+    def test_operations_on_views(self):
+        df = sample_games(30)
+        head = df.head(10)
+        self.assertEqual(head.filter('year < 1990').data,
+                         [row for row in df.data[:10] if row[3] < 1990])
+        self.assertEqual(head.select(['name']).data, [[row[0]] for row in df.data[:10]])
+
+
+class FilterTest(unittest.TestCase):
+    """String and callable filter conditions"""
+    
+    def setUp(self):
+        self.df = DataFrame(
+            data=[[1, 10, 'a'], [2, None, 'b'], [3, 3, 'c'], [4, 1, None], [5, 7, 'a']],
+            columns=['n', 'm', 's'])
+    
+    def matching(self, condition):
+        return self.df.filter(condition)['n']
+    
+    def test_comparisons(self):
+        self.assertEqual(self.matching('m > 3'), [1, 5])
+        self.assertEqual(self.matching('m >= 3'), [1, 3, 5])
+        self.assertEqual(self.matching("s == 'a'"), [1, 5])
+        self.assertEqual(self.matching('s = a'), [1, 5])
+        self.assertEqual(self.matching('n == 2.0'), [2])
+    
+    def test_none_values(self):
+        # None never satisfies an ordering; it is unequal to any literal
+        self.assertEqual(self.matching('m < 100'), [1, 3, 4, 5])
+        self.assertEqual(self.matching("s != 'a'"), [2, 3, 4])
+    
+    def test_and_or(self):
+        self.assertEqual(self.matching("m > 2 and s == 'a'"), [1, 5])
+        self.assertEqual(self.matching("n < 2 or n > 4"), [1, 5])
+        # AND splits first: a and b or c means a AND (b OR c)
+        self.assertEqual(self.matching("n > 1 and s == 'a' or s == 'c'"), [3, 5])
+        self.assertEqual(self.matching("n > 1 AND m < 5"), [3, 4])
+    
+    def test_column_vs_column(self):
+        self.assertEqual(self.matching('m > n'), [1, 5])
+        self.assertEqual(self.matching('m == n'), [3])
+    
+    def test_unknown_column_matches_nothing(self):
+        self.assertEqual(self.matching('missing > 1'), [])
+    
+    def test_callable(self):
+        self.assertEqual(self.df.filter(lambda row: row['m'] is None)['n'], [2])
+    
+    def test_mixed_types(self):
+        # Ordering across types falls back to comparing the str forms for
+        # inequality, as the original row-at-a-time filter did
+        df = DataFrame(data=[[1], ['x'], [3]], columns=['v'])
+        self.assertEqual(df.filter('v > 1')['v'], ['x', 3])
+        self.assertEqual(df.filter("v == x")['v'], ['x'])
+    
+    def test_parse_literal(self):
+        self.assertEqual(DataFrame._parse_literal(' 42 '), 42)
+        self.assertEqual(DataFrame._parse_literal('-7'), -7)
+        self.assertEqual(DataFrame._parse_literal('2.5'), 2.5)
+        self.assertEqual(DataFrame._parse_literal("'2000'"), 2000)
+        self.assertEqual(DataFrame._parse_literal('"Mario"'), 'Mario')
+        self.assertEqual(DataFrame._parse_literal('1e3'), 1000.0)
+
+
+class JoinTest(unittest.TestCase):
+    """Hash join, its row limit, threaded probe and row count"""
+    
+    def setUp(self):
+        self.left = DataFrame(data=[[1, 'a'], [2, 'b'], [None, 'c'], [1, 'd']], columns=['k', 'x'])
+        self.right = DataFrame(data=[[1, 'p', 10], [1, 'q', 20], [3, 'z', 30]], columns=['k', 'x', 'y'])
+    
+    def test_inner(self):
+        joined = self.left.join(self.right, on='k')
+        self.assertEqual(joined.columns, ['k', 'x', 'k_right', 'x_right', 'y'])
+        self.assertEqual(joined.data, [[1, 'a', 1, 'p', 10], [1, 'a', 1, 'q', 20],
+                                       [1, 'd', 1, 'p', 10], [1, 'd', 1, 'q', 20]])
+    
+    def test_left(self):
+        joined = self.left.join(self.right, on='k', how='left')
+        self.assertEqual(joined.data, [[1, 'a', 1, 'p', 10], [1, 'a', 1, 'q', 20],
+                                       [2, 'b', None, None, None], [None, 'c', None, None, None],
+                                       [1, 'd', 1, 'p', 10], [1, 'd', 1, 'q', 20]])
+        # The right side is left untouched
+        self.assertEqual(len(self.right['x']), 3)
+    
+    def test_invalid_arguments(self):
+        with self.assertRaises(KeyError):
+            self.left.join(self.right, on='y')
+        with self.assertRaises(ValueError):
+            self.left.join(self.right, on='k', how='outer')
+    
+    def test_limit_is_prefix_of_full_join(self):
+        games = sample_games()
+        prices = DataFrame(data=[[f"Game {i}", i * 1.5] for i in range(0, 60, 3)] * 2,
+                           columns=['name', 'price'])
+        for how in ('inner', 'left'):
+            full = games.join(prices, on='name', how=how).data
+            for limit in (0, 1, 5, 20, len(full), len(full) + 10):
+                limited = games.join(prices, on='name', how=how, limit=limit)
+                self.assertEqual(limited.data, full[:limit], (how, limit))
+    
+    def test_workers_match_serial(self):
+        games = sample_games()
+        for how in ('inner', 'left'):
+            serial = games.join(games, on='name', how=how)
+            threaded = games.join(games, on='name', how=how, workers=3)
+            self.assertEqual(threaded.data, serial.data)
+    
+    def test_join_count(self):
+        games = sample_games()
+        for how in ('inner', 'left'):
+            self.assertEqual(self.left.join_count(self.right, on='k', how=how),
+                             len(self.left.join(self.right, on='k', how=how)))
+            self.assertEqual(games.join_count(games, on='genre', how=how),
+                             len(games.join(games, on='genre', how=how)))
+
+
+class GroupByTest(unittest.TestCase):
+    """GROUP BY aggregation statistics"""
+    
+    def setUp(self):
+        self.df = DataFrame(
+            data=[['a', 1], ['b', 4], ['a', 3], ['a', None], ['b', 2.5], ['a', 8], ['c', None]],
+            columns=['g', 'v'])
+    
+    def test_functions(self):
+        result = self.df.group_by('g').agg({'v': ['count', 'sum', 'mean', 'min', 'max', 'median', 'std']})
+        self.assertEqual(result.columns, ['g', 'v_count', 'v_sum', 'v_mean', 'v_min', 'v_max',
+                                          'v_median', 'v_std'])
+        a, b, c = result.data
+        self.assertEqual(a[:7], ['a', 3, 12, 4.0, 1, 8, 3])
+        self.assertAlmostEqual(a[7], (26 / 3) ** 0.5)
+        self.assertEqual(b[:7], ['b', 2, 6.5, 3.25, 2.5, 4, 3.25])
+        self.assertAlmostEqual(b[7], 0.75)
+        # A group with only None values gets None for every statistic
+        self.assertEqual(c, ['c'] + [None] * 7)
+    
+    def test_count_and_helpers(self):
+        self.assertEqual(self.df.group_by('g').count().data, [['a', 4], ['b', 2], ['c', 1]])
+        self.assertEqual(self.df.group_by('g').sum().data, [['a', 12], ['b', 6.5], ['c', None]])
+    
+    def test_unknown_function(self):
+        with self.assertRaises(ValueError):
+            self.df.group_by('g').agg({'v': 'mode'})
+    
+    def test_multi_column(self):
+        games = sample_games()
+        result = games.group_by(['platform', 'genre']).agg({'sales': 'sum'})
+        expected = {}
+        for row in games.data:
+            if row[4] is not None:
+                key = (row[2], row[1])
+                expected[key] = expected.get(key, 0) + row[4]
+        self.assertEqual({(p, g): s for p, g, s in result.data}, expected)
+    
+    def test_workers_match_serial(self):
+        games = sample_games()
+        spec = {'sales': ['count', 'sum', 'mean', 'min', 'max', 'median', 'std'], 'year': 'max'}
+        for by in ('genre', ['platform', 'genre'], 'name'):
+            serial = games.group_by(by).agg(spec)
+            threaded = games.group_by(by).agg(spec, workers=4)
+            self.assertEqual(threaded.columns, serial.columns)
+            for got, want in zip(threaded.data, serial.data):
+                self.assertEqual(got[:-2], want[:-2])
+                self.assertAlmostEqual(got[-2], want[-2])
+    
+    def test_bucketed_and_running_paths_agree(self):
+        # With std the running (Welford) loop is used, without it the buckets
+        games = sample_games()
+        running = games.group_by('genre').agg({'sales': ['sum', 'min', 'max', 'std']})
+        bucketed = games.group_by('genre').agg({'sales': ['sum', 'min', 'max']})
+        self.assertEqual([row[:4] for row in running.data], bucketed.data)
+
+
+class LazyFrameTest(unittest.TestCase):
+    """Deferred plans give the same result as running each step eagerly"""
+    
+    def test_fused_filters(self):
+        games = sample_games()
+        lazy = games.lazy().filter('year < 1995').filter("genre == 'RPG'").collect()
+        self.assertEqual(lazy.data, games.filter('year < 1995').filter("genre == 'RPG'").data)
+    
+    def test_join_then_filter(self):
+        games = sample_games()
+        prices = DataFrame(data=[[f"Game {i}", i * 1.5, i % 2] for i in range(0, 60, 2)],
+                           columns=['name', 'price', 'flag'])
+        conditions = [
+            ['year < 1995'],
+            ['price > 20'],
+            ['year < 1995', 'price > 20'],
+            ['year < 1990 or price > 50'],
+            ['flag == 1 and genre == Action'],
+        ]
+        for how in ('inner', 'left'):
+            for steps in conditions:
+                plan = games.lazy().join(prices, on='name', how=how)
+                eager = games.join(prices, on='name', how=how)
+                for condition in steps:
+                    plan = plan.filter(condition)
+                    eager = eager.filter(condition)
+                collected = plan.collect()
+                self.assertEqual(collected.columns, eager.columns)
+                self.assertEqual(collected.data, eager.data, (how, steps))
+    
+    def test_group_by(self):
+        games = sample_games()
+        lazy = games.lazy().filter('year > 1990').group_by('genre').agg({'sales': 'sum'}).collect()
+        eager = games.filter('year > 1990').group_by('genre').agg({'sales': 'sum'})
+        self.assertEqual(lazy.data, eager.data)
+
+
+if __name__ == '__main__':
+    unittest.main()